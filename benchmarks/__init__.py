@@ -0,0 +1,3 @@
+'''
+Benchmarks dos otimizadores: funções de teste padrão (funcoes) e o executor da matriz de casos (executa)
+'''
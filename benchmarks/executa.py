@@ -0,0 +1,214 @@
+'''
+Benchmark dos otimizadores sobre funções de teste padrão.
+
+Exemplo (a partir da raiz do repositório):
+    python -m benchmarks.executa --pops 50 500 --dims 2 10 --geracoes 50 --vetorizado --saida bench.json
+    python -m benchmarks.executa --pops 50 500 --dims 2 10 --geracoes 50 --vetorizado --compara bench.json
+'''
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from otimizacao import GA, ED, PSO, TLBO
+from benchmarks.funcoes import FUNCOES, FUNCOES_BINARIAS, limites
+
+
+class ContaAvaliacoes(object):
+
+    def __init__(self, f_custo):
+        '''
+        Envolve a função custo contando as avaliações (linhas avaliadas) e registrando o histórico
+        (n_avaliacoes, melhor custo) a cada melhora. Em chamadas vetorizadas, a melhora é atribuída ao fim do lote.
+        '''
+        self.f_custo = f_custo
+        self.n_avaliacoes = 0
+        self.melhor = np.inf
+        self.historico = []
+
+
+    def __call__(self, x):
+        custos = self.f_custo(x)
+
+        self.n_avaliacoes += 1 if np.ndim(x) == 1 else len(x)
+
+        menor = float(np.min(custos))
+        if menor < self.melhor:
+            self.melhor = menor
+            self.historico.append((self.n_avaliacoes, menor))
+
+        return custos
+
+
+    def melhor_ate(self, orcamento):
+        '''
+        Melhor custo encontrado com até "orcamento" avaliações
+        '''
+        melhor = None
+        for n, custo in self.historico:
+            if n > orcamento: break
+            melhor = custo
+        return melhor
+
+
+def cria_otimizador(algoritmo, f_custo, n_pop, dim, n_ger, lim_inf, lim_sup, vetorizado, seed):
+    '''
+    Constrói (e executa) o otimizador com parâmetros padrão de benchmark
+    '''
+    if algoritmo == 'GA':
+        otim = GA(n_pop, dim, 0.9, 1/dim, n_ger, f_custo, tipoSel='torneio', verbose=False, vectorized=vetorizado, seed=seed)
+        return otim.bestCusto
+    if algoritmo == 'ED':
+        otim = ED(n_pop, dim, n_ger, 0.9, lim_inf, lim_sup, f_custo, vectorized=vetorizado, seed=seed)
+        return otim.best_custo
+    if algoritmo == 'PSO':
+        otim = PSO(n_pop, dim, lim_inf, lim_sup, n_ger, f_custo, vectorized=vetorizado, seed=seed)
+        return otim.g_best_custo
+    if algoritmo == 'TLBO':
+        otim = TLBO(n_pop, n_ger, dim, lim_inf, lim_sup, f_custo, False, vectorized=vetorizado, seed=seed)
+        return otim.best_custo
+
+    raise ValueError("Algoritmo desconhecido: {}".format(algoritmo))
+
+
+def executa_caso(algoritmo, nome_funcao, n_pop, dim, n_ger, vetorizado, seed, memoria=True, orcamentos=(0.1, 0.25, 0.5, 1.0)):
+    '''
+    Executa um caso do benchmark e retorna o dicionário de métricas
+    '''
+    if algoritmo == 'GA':
+        f_custo, lim_inf, lim_sup = FUNCOES_BINARIAS[nome_funcao], None, None
+    else:
+        f_custo = FUNCOES[nome_funcao][0]
+        lim_inf, lim_sup = limites(nome_funcao, dim)
+
+    contador = ContaAvaliacoes(f_custo)
+
+    # Logs dos otimizadores são descartados para não entrarem na medição
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicio = time.perf_counter()
+        melhor_custo = cria_otimizador(algoritmo, contador, n_pop, dim, n_ger, lim_inf, lim_sup, vetorizado, seed)
+        tempo = time.perf_counter() - inicio
+
+        # Memória medida em uma segunda execução (mesma semente), pois o tracemalloc interfere no tempo
+        pico = None
+        if memoria:
+            tracemalloc.start()
+            cria_otimizador(algoritmo, f_custo, n_pop, dim, n_ger, lim_inf, lim_sup, vetorizado, seed)
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    n_aval = contador.n_avaliacoes
+
+    return {
+        'algoritmo': algoritmo,
+        'funcao': nome_funcao,
+        'n_pop': n_pop,
+        'dim': dim,
+        'n_ger': n_ger,
+        'vetorizado': vetorizado,
+        'seed': seed,
+        'tempo_total': tempo,
+        'tempo_por_geracao': tempo/n_ger,
+        'avaliacoes': n_aval,
+        'avaliacoes_por_segundo': n_aval/tempo if tempo > 0 else None,
+        'memoria_pico_bytes': pico,
+        'melhor_custo': float(melhor_custo),
+        'melhor_por_orcamento': {str(int(f*n_aval)): contador.melhor_ate(int(f*n_aval)) for f in orcamentos},
+    }
+
+
+def casos(algoritmos, pops, dims, funcoes):
+    '''
+    Gera a matriz de casos (algoritmo, função, população, dimensão), respeitando funções de dimensão fixa
+    '''
+    for algoritmo in algoritmos:
+        nomes = FUNCOES_BINARIAS if algoritmo == 'GA' else [f for f in funcoes if f in FUNCOES]
+        for nome in nomes:
+            dim_fixa = None if algoritmo == 'GA' else FUNCOES[nome][3]
+            for dim in ([dim_fixa] if dim_fixa else dims):
+                for n_pop in pops:
+                    yield algoritmo, nome, n_pop, dim
+
+
+def metadados():
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL,
+                                         cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'commit': commit,
+        'data': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'plataforma': platform.platform(),
+    }
+
+
+def compara(base, atual):
+    '''
+    Imprime a razão de tempo (atual/base) dos casos presentes nos dois resultados
+    '''
+    chave = lambda r: (r['algoritmo'], r['funcao'], r['n_pop'], r['dim'], r['n_ger'], r['vetorizado'], r['seed'])
+    casos_base = {chave(r): r for r in base['resultados']}
+
+    print("{:<6} {:<11} {:>7} {:>5} {:>10} {:>10} {:>7}".format('alg', 'funcao', 'n_pop', 'dim', 'base [s]', 'atual [s]', 'razao'))
+    for r in atual['resultados']:
+        b = casos_base.get(chave(r))
+        if b is None: continue
+        print("{:<6} {:<11} {:>7} {:>5} {:>10.4f} {:>10.4f} {:>7.2f}".format(
+            r['algoritmo'], r['funcao'], r['n_pop'], r['dim'], b['tempo_total'], r['tempo_total'], r['tempo_total']/b['tempo_total']))
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos GA, ED, PSO e TLBO")
+    parser.add_argument('--algoritmos', nargs='+', default=['GA', 'ED', 'PSO', 'TLBO'])
+    parser.add_argument('--funcoes', nargs='+', default=list(FUNCOES))
+    parser.add_argument('--pops', nargs='+', type=int, default=[50, 500])
+    parser.add_argument('--dims', nargs='+', type=int, default=[2, 10, 30])
+    parser.add_argument('--geracoes', type=int, default=50)
+    parser.add_argument('--repeticoes', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--vetorizado', action='store_true', help="Avalia a população inteira em uma chamada")
+    parser.add_argument('--sem-memoria', action='store_true', help="Não mede o pico de memória (evita a segunda execução)")
+    parser.add_argument('--saida', default='bench_output.json')
+    parser.add_argument('--compara', default=None, help="Arquivo de resultados anterior para comparação")
+    args = parser.parse_args()
+
+    base = None
+    if args.compara:
+        with open(args.compara) as arq:
+            base = json.load(arq)
+
+    resultados = []
+    for algoritmo, nome, n_pop, dim in casos(args.algoritmos, args.pops, args.dims, args.funcoes):
+        for rep in range(args.repeticoes):
+            r = executa_caso(algoritmo, nome, n_pop, dim, args.geracoes, args.vetorizado, args.seed + rep, not args.sem_memoria)
+            resultados.append(r)
+            print("{:<5} {:<11} n_pop={:<6} dim={:<4} {:.3f}s  {:.0f} aval/s  melhor={:.4g}".format(
+                algoritmo, nome, n_pop, dim, r['tempo_total'], r['avaliacoes_por_segundo'] or 0, r['melhor_custo']))
+
+    saida = {'metadados': metadados(), 'resultados': resultados}
+
+    with open(args.saida, 'w') as arq:
+        json.dump(saida, arq, indent=2)
+
+    if base is not None:
+        compara(base, saida)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import numpy as np
+
+# Funções de teste padrão (https://www.sfu.ca/~ssurjano/optimization.html).
+# Todas operam sobre o último eixo, então aceitam tanto um candidato (dim,) quanto a matriz (n, dim)
+# do modo vetorizado.
+
+
+def sphere(x):
+    return np.sum(x**2, axis=-1)
+
+
+def rastrigin(x):
+    return 10*x.shape[-1] + np.sum(x**2 - 10*np.cos(2*np.pi*x), axis=-1)
+
+
+def rosenbrock(x):
+    return np.sum(100*(x[..., 1:] - x[..., :-1]**2)**2 + (1 - x[..., :-1])**2, axis=-1)
+
+
+def ackley(x):
+    d = x.shape[-1]
+    return (-20*np.exp(-0.2*np.sqrt(np.sum(x**2, axis=-1)/d))
+            - np.exp(np.sum(np.cos(2*np.pi*x), axis=-1)/d) + 20 + np.e)
+
+
+def bukin6(x):
+    return 100*np.sqrt(np.abs(x[..., 1] - 0.01*x[..., 0]**2)) + 0.01*np.abs(x[..., 0] + 10)
+
+
+def onemax(x):
+    '''
+    Problema binário (GA): minimiza o número de genes iguais a zero
+    '''
+    return x.shape[-1] - np.sum(x, axis=-1)
+
+
+# nome: (função, limite inferior, limite superior, dimensão fixa ou None)
+FUNCOES = {
+    'sphere': (sphere, -5.12, 5.12, None),
+    'rastrigin': (rastrigin, -5.12, 5.12, None),
+    'rosenbrock': (rosenbrock, -5.0, 10.0, None),
+    'ackley': (ackley, -32.768, 32.768, None),
+    'bukin6': (bukin6, [-15.0, -3.0], [-5.0, 3.0], 2),
+}
+
+FUNCOES_BINARIAS = {
+    'onemax': onemax,
+}
+
+
+def limites(nome, dim):
+    '''
+    Retorna os vetores (lim_inf, lim_sup) da função para a dimensão pedida
+    '''
+    _, lim_inf, lim_sup, _ = FUNCOES[nome]
+    return np.broadcast_to(np.asarray(lim_inf, dtype=float), dim).copy(), np.broadcast_to(np.asarray(lim_sup, dtype=float), dim).copy()
@@ -0,0 +1,3 @@
+'''
+Exemplos de uso dos otimizadores, executados a partir da raiz do repositório (python -m exemplos.ed)
+'''
@@ -0,0 +1,12 @@
+from otimizacao import ED
+from exemplos.funcoes import bukin6
+
+
+def main():
+
+    otim = ED(30, 2, 40, 0.5, [-15, -5], [-3, 3], bukin6, verbose=True)
+    print(otim.best_indiv, otim.best_custo)
+
+
+if __name__ == "__main__":
+    main()
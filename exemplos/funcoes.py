@@ -0,0 +1,8 @@
+import numpy as np
+
+
+def bukin6(x):
+    '''
+    Função Bukin N. 6 (http://www.sfu.ca/~ssurjano/bukin6.html) - Mínimo global em [-10, 1]
+    '''
+    return 100*np.sqrt(np.abs(x[1]-0.01*x[0]**2))+0.01*np.abs(x[0]+10)
@@ -0,0 +1,14 @@
+import numpy as np
+
+from otimizacao import PSO
+from exemplos.funcoes import bukin6
+
+
+def main():
+
+    opt = PSO(50, 2, np.array([-15, -3]), np.array([-5, 3]), 30, bukin6, verbose=True)
+    print(opt.g_best, opt.g_best_custo)
+
+
+if __name__ == '__main__':
+    main()
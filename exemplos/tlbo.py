@@ -0,0 +1,23 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+from otimizacao import TLBO
+from exemplos.funcoes import bukin6
+
+
+def main():
+
+    otim = TLBO(40, 100, 2, np.array([-15, -3]), np.array([-5, 3]), bukin6, True)
+
+    print(otim.get_best())
+
+    plt.figure()
+    plt.title("Custo por iteração")
+    plt.plot(otim.vet_best_iter)
+    plt.xlabel("Iterações")
+    plt.ylabel("Custo")
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
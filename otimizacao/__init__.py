@@ -0,0 +1,62 @@
+'''
+Algoritmos de otimização metaheurística: GA, ED, PSO e TLBO, com avaliação vetorizada ou paralela,
+critérios de parada, checkpoint, observadores, modelo de ilhas, múltiplos inícios, pré-seleção por surrogato e perfil de desempenho.
+
+Os submódulos são importados sob demanda: "from otimizacao import PSO" carrega apenas pso.py e suas
+dependências (sem o GA, o ED, o TLBO ou bibliotecas opcionais como Numba).
+'''
+
+import importlib
+
+# Nome exportado -> submódulo que o define
+SUBMODULOS = {
+    'Otimizador': 'otimizador',
+    'GA': 'algoritmo_genetico',
+    'ED': 'ed',
+    'PSO': 'pso',
+    'TLBO': 'tlbo',
+    'CriterioParada': 'parada',
+    'Checkpoint': 'checkpoint',
+    'salva_estado': 'checkpoint',
+    'carrega_estado': 'checkpoint',
+    'ObservadorNulo': 'observadores',
+    'ObservadorLog': 'observadores',
+    'ObservadorHistorico': 'observadores',
+    'ObservadorComposto': 'observadores',
+    'Reinicio': 'diversidade',
+    'cria_avaliador': 'avaliador',
+    'AvaliadorSerial': 'avaliador',
+    'AvaliadorThreads': 'avaliador',
+    'AvaliadorProcessos': 'avaliador',
+    'AvaliadorCompartilhado': 'avaliador',
+    'ModeloIlhas': 'ilhas',
+    'PSOLote': 'multi_inicio',
+    'EDLote': 'multi_inicio',
+    'TLBOLote': 'multi_inicio',
+    'cria_estrategia': 'limites',
+    'Restricoes': 'limites',
+    'PreSelecao': 'surrogato',
+    'ExecucaoAssincrona': 'assincrono',
+    'JDE': 'adaptacao',
+    'SHADE': 'adaptacao',
+    'Perfil': 'perfil',
+}
+
+__all__ = sorted(SUBMODULOS)
+
+
+def __getattr__(nome):
+    '''
+    Importa o submódulo que define "nome" no primeiro acesso e guarda o objeto no pacote
+    '''
+    if nome not in SUBMODULOS:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, nome))
+
+    objeto = getattr(importlib.import_module('.' + SUBMODULOS[nome], __name__), nome)
+    globals()[nome] = objeto
+
+    return objeto
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
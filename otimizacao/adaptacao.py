@@ -0,0 +1,161 @@
+import numpy as np
+
+
+class JDE(object):
+
+    atributos_estado = ('F', 'CR')    # Salvos pelo checkpoint do otimizador (ver checkpoint.py)
+
+
+    def __init__(self, tau_F=0.1, tau_CR=0.1, F_min=0.1, F_max=1.0, F_inicial=0.5, CR_inicial=0.9):
+        '''
+        Auto-adaptação jDE (Brest et al., 2006): cada indivíduo carrega seus próprios F e CR. A cada vetor
+        experimental, F é sorteado novamente em [F_min, F_max] com probabilidade tau_F e CR em [0, 1] com
+        probabilidade tau_CR; os valores sorteados passam ao indivíduo apenas se o experimental o substituir.
+        '''
+        self.tau_F = tau_F
+        self.tau_CR = tau_CR
+        self.F_min = F_min
+        self.F_max = F_max
+        self.F_inicial = F_inicial
+        self.CR_inicial = CR_inicial
+
+        self.F = None       # F de cada indivíduo
+        self.CR = None      # CR de cada indivíduo
+        self.F_teste = None     # Valores usados nos experimentais aguardando resultado
+        self.CR_teste = None
+
+
+    def inicia(self, n):
+        self.F = np.full(n, float(self.F_inicial))
+        self.CR = np.full(n, float(self.CR_inicial))
+        self.F_teste = self.F.copy()
+        self.CR_teste = self.CR.copy()
+
+
+    def sorteia(self, alvos, rng):
+        '''
+        F e CR dos vetores experimentais dos "alvos"
+        '''
+        n = len(alvos)
+        sorteios = rng.random((4, n))
+
+        F = np.where(sorteios[0] < self.tau_F, self.F_min + sorteios[1]*(self.F_max - self.F_min), self.F[alvos])
+        CR = np.where(sorteios[2] < self.tau_CR, sorteios[3], self.CR[alvos])
+
+        self.F_teste[alvos] = F
+        self.CR_teste[alvos] = CR
+
+        return F, CR
+
+
+    def registra(self, alvos, sucesso, ganho):
+        '''
+        Resultado dos experimentais dos "alvos": os indivíduos substituídos herdam os parâmetros usados
+        '''
+        alvos = np.asarray(alvos)[sucesso]
+        self.F[alvos] = self.F_teste[alvos]
+        self.CR[alvos] = self.CR_teste[alvos]
+
+
+class SHADE(object):
+
+    # Salvos pelo checkpoint do otimizador. Os sucessos pendentes não são salvos: a memória é atualizada
+    # a cada n resultados, então a lista está vazia ao fim de cada geração, quando o checkpoint é feito
+    atributos_estado = ('M_F', 'M_CR', 'posicao', 'n_registrados')
+
+
+    def __init__(self, memoria=5, F_inicial=0.5, CR_inicial=0.5):
+        '''
+        Adaptação no estilo JADE com memória de histórico de sucesso (SHADE, Tanabe e Fukunaga, 2013). Cada
+        vetor experimental usa F ~ Cauchy(M_F[k], 0.1) e CR ~ Normal(M_CR[k], 0.1), com k sorteado entre as
+        "memoria" posições da memória. A cada n resultados registrados (n = tamanho da população), a posição
+        seguinte da memória recebe a média de Lehmer dos F bem-sucedidos e a média dos CR bem-sucedidos,
+        ponderadas pela redução de custo obtida.
+        '''
+        self.memoria = memoria
+        self.M_F = np.full(memoria, float(F_inicial))
+        self.M_CR = np.full(memoria, float(CR_inicial))
+        self.posicao = 0    # Próxima posição da memória a ser atualizada
+
+        self.n = None
+        self.F_teste = None
+        self.CR_teste = None
+        self.sucessos = []  # (F, CR, ganho) dos experimentais bem-sucedidos desde a última atualização
+        self.n_registrados = 0
+
+
+    def inicia(self, n):
+        self.n = n
+        self.F_teste = np.zeros(n)
+        self.CR_teste = np.zeros(n)
+
+
+    def sorteia(self, alvos, rng):
+        '''
+        F e CR dos vetores experimentais dos "alvos"
+        '''
+        n = len(alvos)
+        k = rng.integers(0, self.memoria, n)
+
+        CR = np.clip(self.M_CR[k] + 0.1*rng.standard_normal(n), 0, 1)
+
+        # Cauchy truncada em 1; valores não positivos são sorteados novamente
+        F = self.M_F[k] + 0.1*rng.standard_cauchy(n)
+        invalidos = F <= 0
+        while invalidos.any():
+            F[invalidos] = self.M_F[k[invalidos]] + 0.1*rng.standard_cauchy(np.count_nonzero(invalidos))
+            invalidos = F <= 0
+        F = np.minimum(F, 1)
+
+        self.F_teste[alvos] = F
+        self.CR_teste[alvos] = CR
+
+        return F, CR
+
+
+    def registra(self, alvos, sucesso, ganho):
+        '''
+        Resultado dos experimentais dos "alvos"; a memória é atualizada a cada n resultados
+        '''
+        alvos = np.asarray(alvos)
+        sucesso = np.asarray(sucesso, dtype=bool)
+
+        if sucesso.any():
+            self.sucessos.append((self.F_teste[alvos[sucesso]], self.CR_teste[alvos[sucesso]], np.asarray(ganho)[sucesso]))
+
+        self.n_registrados += len(alvos)
+        if self.n_registrados >= self.n:
+            self.atualiza_memoria()
+
+
+    def atualiza_memoria(self):
+
+        if self.sucessos:
+            F, CR, ganho = (np.concatenate(v) for v in zip(*self.sucessos))
+            pesos = ganho/ganho.sum() if ganho.sum() > 0 else np.full(len(ganho), 1/len(ganho))
+
+            self.M_F[self.posicao] = np.sum(pesos*F**2)/np.sum(pesos*F)
+            self.M_CR[self.posicao] = np.sum(pesos*CR)
+            self.posicao = (self.posicao + 1) % self.memoria
+
+        self.sucessos = []
+        self.n_registrados = 0
+
+
+ADAPTACOES = {
+    'jde': JDE,
+    'shade': SHADE,
+}
+
+
+def cria_adaptacao(adaptacao):
+    '''
+    Retorna o esquema de adaptação de F e CR da ED a partir do seu nome ('jde' ou 'shade'), None (parâmetros
+    fixos) ou o próprio objeto
+    '''
+    if isinstance(adaptacao, str):
+        if adaptacao not in ADAPTACOES:
+            raise ValueError("Adaptação desconhecida: {}".format(adaptacao))
+        return ADAPTACOES[adaptacao]()
+
+    return adaptacao
@@ -0,0 +1,34 @@
+import numpy as np
+
+
+def cria_rng(seed=None):
+    '''
+    Retorna o gerador de números aleatórios de uma instância.
+    seed: None (semente aleatória), int, np.random.SeedSequence ou um np.random.Generator já criado
+    '''
+    if isinstance(seed, np.random.Generator):
+        return seed
+
+    return np.random.default_rng(seed)
+
+
+def uniforme(rng, lim_inf, lim_sup, forma):
+    '''
+    Soluções sorteadas com distribuição uniforme entre os limites (vetores (dim,)), com shape "forma" = (..., dim).
+    Usado na criação das populações iniciais e nos reinícios de todos os otimizadores.
+    '''
+    return lim_inf + (lim_sup - lim_inf)*rng.random(forma)
+
+
+def gera_rngs(seed, n):
+    '''
+    Cria n geradores estatisticamente independentes a partir de uma semente (via SeedSequence.spawn),
+    para reinícios, ilhas ou execuções em paralelo reprodutíveis.
+    '''
+    if isinstance(seed, np.random.Generator):
+        return seed.spawn(n)
+
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    return [np.random.default_rng(s) for s in seed.spawn(n)]
@@ -0,0 +1,625 @@
+import numpy as np
+from collections import OrderedDict
+from functools import partial
+
+from .otimizador import Otimizador
+from .kernels import inverte_genes
+
+# Operadores aceitos em cada modo
+SELECOES = ('roleta', 'torneio')
+CRUZAMENTOS_BINARIOS = ('ponto', 'uniforme')
+CRUZAMENTOS_REAIS = ('ponto', 'uniforme', 'sbx', 'blx')
+MUTACOES_BINARIAS = ('bit-a-bit', 'aleatBit')
+MUTACOES_REAIS = ('polinomial', 'gaussiana')
+
+
+def desempacota_bits(cromossomos, nCrom):
+    '''
+    Converte cromossomos empacotados (uint8) para genes 0/1 de tamanho nCrom, com um byte por gene. O resultado
+    é visto como int8 (sem cópia), o que evita que a função custo opere com uint8 sem sinal (1 - x, por exemplo)
+    sem multiplicar por 8 a memória, como faria a conversão para int64
+    '''
+    return np.unpackbits(cromossomos, axis=-1, count=nCrom).view(np.int8)
+
+
+def custo_desempacotado(fCusto, nCrom, cromossomos):
+    '''
+    Desempacota os cromossomos antes de chamar a função custo.
+    Fica no nível do módulo para poder ser enviada aos workers de um pool de processos.
+    '''
+    return fCusto(desempacota_bits(cromossomos, nCrom))
+
+
+class GA(Otimizador):
+
+    atributos_estado = ('pop', 'custos', 'popAvaliada', 'bestSol', 'bestCusto', 'geracao', 'n_avaliacoes')
+    operadores_perfil = Otimizador.operadores_perfil + ('proxima_geracao', 'avalia_com_cache', 'set_best',
+                                                        'selecao_roleta', 'selecao_torneio',
+                                                        'cruzamento_ponto', 'cruzamento_uniforme', 'cruzamento_sbx', 'cruzamento_blx',
+                                                        'mutacao_bit', 'mutacao_aleatbit', 'mutacao_polinomial', 'mutacao_gaussiana')
+
+
+    def __init__(self, nInd, nCrom, probCruz, probMut, nGer, fCusto, tipoSel='roleta', tipoCruz=None, tipoMut=None, elit=True, verbose=False, vectorized=False, empacotado=False, custoEmpacotado=False, avaliador=None, tamCache=None, seed=None, parada=None, checkpoint=None, observador=None, limInf=None, limSup=None, etaCruz=15, etaMut=20, alphaBlx=0.5, sigmaMut=0.1, estrategiaLimites='corte', perfil=None, executar=True):
+        '''
+        Algoritmo genético para problemas de minimização de custo.
+
+        nInd - Número de indivíduos
+        nCrom - Número de cromossomos (dimensão do problema)
+        probCruz - Probabilidade de cruzamento
+        probMut - Probabilidade de mutação (por gene, exceto em 'aleatBit', que é por indivíduo)
+        tipoSel - Tipo de seleção: 'roleta' ou 'torneio'. Roleta é o padrão. Operadores inválidos para o modo geram ValueError
+        tipoCruz - Tipo de cruzamento: 'ponto' ou 'uniforme' e, no modo real, também 'sbx' ou 'blx'.
+                   O padrão é 'ponto' no modo binário e 'sbx' no modo real
+        tipoMut - Tipo de mutação: 'bit-a-bit' ou 'aleatBit' no modo binário, 'polinomial' ou 'gaussiana' no modo real.
+                  O padrão é 'bit-a-bit' no modo binário e 'polinomial' no modo real
+        elit - Se terá elitismo, isto é, se a melhor solução de todas as gerações é guardada. Com False, get_best()
+               retorna a melhor solução da última geração avaliada. Inicialmente True.
+        nGer - Número de gerações
+        fcusto - Função custo
+        verbose - Se a otimização deve mostrar logs de geração e menor custo atual. Ignorado se um observador for dado
+        vectorized - Se True, a função custo recebe a população inteira (nInd, nCrom) e retorna o vetor de custos (nInd,)
+        empacotado - Se True, a população é armazenada com 8 genes por byte (np.packbits), com shape (nInd, ceil(nCrom/8))
+        custoEmpacotado - Se True (e empacotado), a função custo recebe os cromossomos empacotados; caso contrário eles
+                           são desempacotados apenas no momento da avaliação
+        avaliador - Backend de avaliação: 'serial', 'threads', 'processos', 'compartilhado' ou um objeto do módulo avaliador. Serial é o padrão
+        tamCache - Número máximo de custos memorizados por cromossomo (descarte LRU). None desativa o cache
+        seed - Semente (int ou SeedSequence) ou np.random.Generator usado em todos os sorteios desta instância
+        parada - Objeto CriterioParada com critérios de parada antecipada (custo alvo, estagnação, tempo, avaliações)
+        checkpoint - Objeto Checkpoint para salvar o estado periodicamente (ver checkpoint.py)
+        observador - Observador (ou lista de observadores) chamado a cada geração (ver observadores.py)
+        limInf, limSup - Limites das variáveis. Se informados (ambos), o GA opera no modo real: cada indivíduo é um vetor
+                         de nCrom valores contínuos, em vez de genes binários
+        etaCruz, etaMut - Índices de distribuição do cruzamento SBX e da mutação polinomial (maiores geram filhos
+                          mais próximos dos pais)
+        alphaBlx - Extensão do intervalo do cruzamento BLX-alpha além dos pais
+        sigmaMut - Desvio padrão da mutação gaussiana, como fração da largura do intervalo de cada variável
+        estrategiaLimites - Estratégia de limites do modo real: 'corte', 'reflexao', 'reamostragem', 'ponto_medio' ou
+                            um objeto do módulo limites. Corte é o padrão
+        perfil - Se True (ou um objeto Perfil, ver perfil.py), acumula o tempo e as chamadas de cada operador; veja relatorio_perfil()
+        executar - Se True, a otimização é executada já na construção. Caso contrário, use run(), step() ou ask()/tell()
+        '''
+
+        real = limInf is not None or limSup is not None
+        tipoCruz = tipoCruz or ('sbx' if real else 'ponto')
+        tipoMut = tipoMut or ('polinomial' if real else 'bit-a-bit')
+
+        # Validação antes da criação do avaliador e da população
+        if real and (limInf is None or limSup is None):
+            raise ValueError("O modo real exige os dois limites: limInf e limSup")
+        if real and empacotado:
+            raise ValueError("O modo real não pode ser empacotado")
+        if tipoSel not in SELECOES:
+            raise ValueError("Seleção desconhecida: {}. Use {}".format(tipoSel, ', '.join(SELECOES)))
+
+        cruzamentos, mutacoes, modo = (CRUZAMENTOS_REAIS, MUTACOES_REAIS, 'real') if real else (CRUZAMENTOS_BINARIOS, MUTACOES_BINARIAS, 'binário')
+        if tipoCruz not in cruzamentos:
+            raise ValueError("Cruzamento '{}' inválido no modo {}: use {}".format(tipoCruz, modo, ', '.join(cruzamentos)))
+        if tipoMut not in mutacoes:
+            raise ValueError("Mutação '{}' inválida no modo {}: use {}".format(tipoMut, modo, ', '.join(mutacoes)))
+
+        Otimizador.__init__(self, fCusto, nCrom, nGer, limInf, limSup, vectorized, avaliador, None, seed, parada, checkpoint, verbose, observador, estrategiaLimites, None, perfil)
+
+        self.nInd = nInd
+        self.nCrom = nCrom
+        self.probCruz = probCruz
+        self.probMut = probMut
+        self.fCusto = fCusto
+        self.real = real
+        self.tipoSel = tipoSel
+        self.tipoCruz = tipoCruz
+        self.tipoMut = tipoMut
+        self.elit = elit
+        self.empacotado = empacotado
+        self.custoEmpacotado = custoEmpacotado
+        self.tamCache = tamCache
+
+        if self.real:
+            self.etaCruz = etaCruz
+            self.etaMut = etaMut
+            self.alphaBlx = alphaBlx
+            self.sigmaMut = sigmaMut
+
+        # Cache de custos: chave são os bytes do cromossomo, em ordem do uso mais antigo ao mais recente
+        self.cache = OrderedDict()
+        self.cacheHits = 0
+        self.cacheMisses = 0
+
+        self.bestSol = None
+        self.bestCusto = np.inf # Inicia como infinito, para que o proximo custo sempre seja menor
+
+        # Criando população de maneira aleatória
+        if self.real:
+            self.pop = self.popula(self.nInd)
+        elif self.empacotado:
+            self.nBytes = (self.nCrom + 7)//8
+            self.pop = self.rng.integers(0, 256, (self.nInd, self.nBytes), dtype=np.uint8)
+            self.pop[:, -1] &= self.mascara_ultimo_byte() # Bits de preenchimento ficam sempre em zero
+        else:
+            self.pop = self.rng.integers(0, 2, (self.nInd, self.nCrom))
+
+        self.custos = np.ones(self.nInd)
+        self.popAvaliada = None # População à qual os custos se referem (a anterior aos filhos atuais)
+
+        # Iniciando otimização
+        if executar: self.run()
+
+        
+    def avalia_pop(self):
+        '''
+        Faz a avaliação da população e atualiza o vetor de custos
+        '''
+        if self.tamCache:
+            self.custos = self.avalia_com_cache(self.pop)
+        else:
+            self.custos = self.avalia_cands(self.pop)
+
+
+    def avalia_com_cache(self, cands):
+        '''
+        Avalia apenas os cromossomos ausentes do cache (cada cromossomo repetido é avaliado uma única vez)
+        e descarta os custos usados há mais tempo quando o cache passa de tamCache itens
+        '''
+        custos = np.empty(len(cands))
+        faltantes = OrderedDict() # chave -> posições dos candidatos ainda sem custo
+
+        for i, cand in enumerate(cands):
+            chave = cand.tobytes()
+            custo = self.cache.get(chave)
+
+            if custo is None:
+                faltantes.setdefault(chave, []).append(i)
+            else:
+                self.cache.move_to_end(chave)
+                custos[i] = custo
+                self.cacheHits += 1
+
+        if faltantes:
+            novos_custos = self.avalia_cands(cands[[pos[0] for pos in faltantes.values()]])
+
+            for (chave, pos), custo in zip(faltantes.items(), novos_custos):
+                custos[pos] = custo
+                self.cache[chave] = custo
+
+            self.cacheMisses += len(faltantes)
+            self.cacheHits += sum(len(pos) for pos in faltantes.values()) - len(faltantes) # Repetidos na mesma geração
+
+            while len(self.cache) > self.tamCache:
+                self.cache.popitem(last=False)
+
+        return custos
+
+
+    def funcao_custo(self):
+        '''
+        Função enviada ao avaliador: no modo empacotado, cada bloco é desempacotado no próprio worker
+        '''
+        if self.empacotado and not self.custoEmpacotado:
+            return partial(custo_desempacotado, self.fCusto, self.nCrom)
+
+        return self.fCusto
+
+
+    def desempacota(self, cromossomos):
+        '''
+        Converte cromossomos empacotados (uint8) para o vetor de genes 0/1 de tamanho nCrom
+        '''
+        return desempacota_bits(cromossomos, self.nCrom)
+
+
+    def mascara_ultimo_byte(self):
+        '''
+        Máscara dos bits válidos do último byte de um cromossomo empacotado
+        '''
+        validos = self.nCrom - 8*(self.nBytes-1)
+        return np.uint8((0xFF << (8-validos)) & 0xFF)
+
+
+    def selecao_roleta(self):
+        '''
+        Método de seleção do tipo roleta viciada
+        '''
+
+       # Transformação do vetor de custos para suportar valores negativos e inverter os valores maiores nos menores e vice-versa.
+       # O número 2 é para que o maior custo normalizado fique com valor unitário, possuindo ainda uma chance de ser selecionado.
+       # Caso não exista custos com valores negativos, o menor custo ficará com valor 2 e o maior com 1.
+       
+        novo_custo = 2 - self.custos/np.abs(self.custos.max())
+
+        custo_acum = np.cumsum(novo_custo)
+
+        # Cada pai é o primeiro indivíduo cujo custo acumulado alcança o valor sorteado
+        val_selected = custo_acum[-1]*self.rng.random(self.nInd)
+        pos_pais = np.searchsorted(custo_acum, val_selected, side='left')
+        pos_pais = np.minimum(pos_pais, self.nInd-1) # Proteção contra arredondamento no último acumulado
+
+        return self.pop[pos_pais]
+    
+
+    def selecao_torneio(self):
+
+        pos_indv1 = self.rng.integers(0, self.nInd, self.nInd)
+        pos_indv2 = self.rng.integers(0, self.nInd, self.nInd)
+
+        pos_pais = np.where(self.custos[pos_indv1]<=self.custos[pos_indv2], pos_indv1, pos_indv2)
+
+        return self.pop[pos_pais]
+        
+
+    def troca_genes(self, pais, mascara):
+        '''
+        Cruza os pares de pais (0 e 1, 2 e 3, ...) trocando os genes marcados em "mascara" (nInd//2, nCrom),
+        ou os bits marcados na máscara empacotada (nInd//2, nBytes). Com número ímpar de indivíduos, o último
+        é copiado sem cruzamento.
+        '''
+        filhos = pais.copy()
+
+        n = 2*(self.nInd//2)
+        pai1 = pais[0:n:2]
+        pai2 = pais[1:n:2]
+
+        if self.real:
+            filhos[0:n:2] = np.where(mascara, pai2, pai1)
+            filhos[1:n:2] = np.where(mascara, pai1, pai2)
+            return filhos
+
+        # Troca via XOR: os genes diferentes entre os pais e marcados na máscara são invertidos nos dois filhos
+        dif = (pai1 ^ pai2) & mascara
+
+        filhos[0:n:2] = pai1 ^ dif
+        filhos[1:n:2] = pai2 ^ dif
+
+        return filhos
+
+
+    def cruzamento_ponto(self, pais):
+
+        n_pares = self.nInd//2
+
+        cruza = self.rng.random(n_pares) <= self.probCruz
+        ponto_cruz = self.rng.integers(0, self.nCrom, n_pares)
+
+        # Genes anteriores ao ponto de cruzamento são trocados nos pares que cruzam
+        if self.empacotado:
+            cheios = ponto_cruz[:, np.newaxis]//8
+            parcial = (0xFF << (8 - ponto_cruz[:, np.newaxis]%8)) & 0xFF
+
+            pos_byte = np.arange(self.nBytes)
+            mascara = np.where(pos_byte < cheios, 0xFF, np.where(pos_byte == cheios, parcial, 0)).astype(np.uint8)
+            mascara[~cruza] = 0
+        else:
+            mascara = (np.arange(self.nCrom) < ponto_cruz[:, np.newaxis]) & cruza[:, np.newaxis]
+
+        return self.troca_genes(pais, mascara)
+
+
+    def cruzamento_uniforme(self, pais):
+
+        n_pares = self.nInd//2
+
+        cruza = self.rng.random(n_pares) <= self.probCruz
+        if self.empacotado:
+            # Cada bit do byte sorteado indica a troca de um gene; os bits de preenchimento são zero nos dois pais
+            mascara = self.rng.integers(0, 256, (n_pares, self.nBytes), dtype=np.uint8)
+            mascara[~cruza] = 0
+        else:
+            mascara = (self.rng.integers(0, 2, (n_pares, self.nCrom))==1) & cruza[:, np.newaxis]
+
+        return self.troca_genes(pais, mascara)
+
+
+    def mutacao_bit(self, filhos):
+
+        if self.empacotado:
+            filhos_m = filhos.copy()
+
+            pos = self.sorteia_posicoes(self.nInd*self.nCrom, self.probMut)
+            linha, gene = np.divmod(pos, self.nCrom)
+
+            # XOR com a máscara do bit; ufunc.at pois vários genes podem cair no mesmo byte
+            np.bitwise_xor.at(filhos_m, (linha, gene >> 3), (0x80 >> (gene & 7)).astype(np.uint8))
+
+            return filhos_m
+
+        mascara = self.rng.random(filhos.shape) <= self.probMut
+
+        return inverte_genes(filhos, mascara) # Inverte de 1 para 0 e de 0 para 1
+
+
+    def sorteia_posicoes(self, n_total, prob):
+        '''
+        Sorteia as posições (em ordem crescente) de um processo de Bernoulli com probabilidade "prob" em n_total
+        ensaios, através dos saltos geométricos entre sucessos. O custo é proporcional ao número de mutações,
+        e não ao número total de genes.
+        '''
+        if prob <= 0: return np.zeros(0, dtype=np.int64)
+        if prob >= 1: return np.arange(n_total)
+
+        esperado = n_total*prob
+        n_saltos = int(esperado + 4*np.sqrt(esperado)) + 16
+
+        posicoes = []
+        ultima = -1
+
+        while True:
+            pos = ultima + np.cumsum(self.rng.geometric(prob, n_saltos))
+            posicoes.append(pos[pos < n_total])
+
+            if pos[-1] >= n_total: break
+            ultima = pos[-1]
+
+        return np.concatenate(posicoes)
+
+
+    def mutacao_aleatbit(self, filhos):
+
+        filhos_m = filhos.copy()
+
+        muta = np.flatnonzero(self.rng.random(self.nInd) <= self.probMut)
+        bit_mut = self.rng.integers(0, self.nCrom, len(muta))
+
+        if self.empacotado:
+            filhos_m[muta, bit_mut >> 3] ^= (0x80 >> (bit_mut & 7)).astype(np.uint8)
+        else:
+            filhos_m[muta, bit_mut] = 1 - filhos_m[muta, bit_mut] # Inverte de 1 para 0 e de 0 para 1 no bit aleatório
+        
+        return filhos_m
+        
+
+    def cruza_pares(self, pais, gera_filhos):
+        '''
+        Aplica "gera_filhos(pai1, pai2)" aos pares de pais (0 e 1, 2 e 3, ...) sorteados para cruzamento
+        com probabilidade probCruz. Os demais pares, e o último indivíduo com nInd ímpar, são copiados.
+        '''
+        filhos = pais.copy()
+
+        n = 2*(self.nInd//2)
+        cruza = np.flatnonzero(self.rng.random(self.nInd//2) <= self.probCruz)
+        pai1 = pais[0:n:2][cruza]
+        pai2 = pais[1:n:2][cruza]
+
+        filho1, filho2 = gera_filhos(pai1, pai2)
+
+        filhos[2*cruza] = self.limita_cands(filho1, pai1)
+        filhos[2*cruza+1] = self.limita_cands(filho2, pai2)
+
+        return filhos
+
+
+    def cruzamento_sbx(self, pais):
+        '''
+        Cruzamento binário simulado (SBX): os filhos são espalhados simetricamente em torno dos pais, com
+        espalhamento beta sorteado de uma distribuição polinomial de índice etaCruz
+        '''
+        def gera_filhos(pai1, pai2):
+            u = self.rng.random(pai1.shape)
+            expoente = 1/(self.etaCruz + 1)
+            beta = np.where(u <= 0.5, (2*u)**expoente, (1/(2*(1 - u)))**expoente)
+
+            filho1 = 0.5*((1 + beta)*pai1 + (1 - beta)*pai2)
+            filho2 = 0.5*((1 - beta)*pai1 + (1 + beta)*pai2)
+
+            return filho1, filho2
+
+        return self.cruza_pares(pais, gera_filhos)
+
+
+    def cruzamento_blx(self, pais):
+        '''
+        Cruzamento BLX-alpha: cada variável dos filhos é sorteada uniformemente no intervalo entre os pais,
+        estendido de alphaBlx vezes a distância entre eles para cada lado
+        '''
+        def gera_filhos(pai1, pai2):
+            menor = np.minimum(pai1, pai2)
+            dist = np.abs(pai1 - pai2)
+            inicio = menor - self.alphaBlx*dist
+            largura = (1 + 2*self.alphaBlx)*dist
+
+            filho1 = inicio + largura*self.rng.random(pai1.shape)
+            filho2 = inicio + largura*self.rng.random(pai1.shape)
+
+            return filho1, filho2
+
+        return self.cruza_pares(pais, gera_filhos)
+
+
+    def mutacao_polinomial(self, filhos):
+        '''
+        Mutação polinomial: cada variável, com probabilidade probMut, recebe uma perturbação proporcional
+        à largura do seu intervalo, sorteada de uma distribuição polinomial de índice etaMut
+        '''
+        muta = self.rng.random(filhos.shape) <= self.probMut
+        u = self.rng.random(filhos.shape)
+        expoente = 1/(self.etaMut + 1)
+
+        delta = np.where(u < 0.5, (2*u)**expoente - 1, 1 - (2*(1 - u))**expoente)
+
+        return self.limita_cands(np.where(muta, filhos + delta*(self.lim_sup - self.lim_inf), filhos), filhos)
+
+
+    def mutacao_gaussiana(self, filhos):
+        '''
+        Mutação gaussiana: cada variável, com probabilidade probMut, recebe um ruído normal com desvio padrão
+        sigmaMut vezes a largura do seu intervalo
+        '''
+        muta = self.rng.random(filhos.shape) <= self.probMut
+        ruido = self.rng.normal(0, 1, filhos.shape)*self.sigmaMut*(self.lim_sup - self.lim_inf)
+
+        return self.limita_cands(np.where(muta, filhos + ruido, filhos), filhos)
+
+
+    def set_best(self):
+        '''
+        Atualiza a melhor solução com o melhor indivíduo da população avaliada: com elitismo, apenas se ele
+        superar a melhor solução já encontrada; sem elitismo, sempre (melhor solução da geração)
+        '''
+        best_pos = np.argmin(self.custos)
+        custo = self.custos[best_pos]
+
+        if custo < self.bestCusto or not self.elit:
+            self.bestCusto = custo
+            self.bestSol = self.desempacota(self.pop[best_pos]) if self.empacotado else self.pop[best_pos]
+        
+
+    def ask(self):
+        '''
+        Retorna a população atual a ser avaliada, no mesmo formato recebido pela função custo
+        (desempacotada, a menos que custoEmpacotado seja True). Os custos devem ser informados em tell().
+        '''
+        if self.empacotado and not self.custoEmpacotado:
+            return self.desempacota(self.pop)
+
+        return self.pop
+
+
+    def recebe_custos(self, custos):
+        '''
+        Recebe os custos da população retornada por ask() e cria a próxima geração
+        '''
+        self.custos = np.asarray(custos, dtype=float)
+        self.proxima_geracao()
+
+
+    def step(self):
+        '''
+        Executa uma geração: avaliação da população (com cache, se ativo), seleção, cruzamento e mutação
+        '''
+        self.avalia_pop()
+        self.proxima_geracao()
+
+
+    def proxima_geracao(self):
+        '''
+        Atualiza o melhor indivíduo a partir dos custos atuais e substitui a população pelos filhos
+        '''
+        self.set_best()
+
+        # Seleção dos pais
+        if self.tipoSel == 'roleta':
+            pais = self.selecao_roleta()
+        else:
+            pais = self.selecao_torneio()
+        
+        # Cruzamento para criação dos filhos
+        if self.tipoCruz == 'ponto':
+            filhos = self.cruzamento_ponto(pais)
+        elif self.tipoCruz == 'sbx':
+            filhos = self.cruzamento_sbx(pais)
+        elif self.tipoCruz == 'blx':
+            filhos = self.cruzamento_blx(pais)
+        else:
+            filhos = self.cruzamento_uniforme(pais)
+        
+        # Mutação dos filhos
+        if self.tipoMut == 'bit-a-bit':
+            filhos_m = self.mutacao_bit(filhos)
+        elif self.tipoMut == 'polinomial':
+            filhos_m = self.mutacao_polinomial(filhos)
+        elif self.tipoMut == 'gaussiana':
+            filhos_m = self.mutacao_gaussiana(filhos)
+        else:
+            filhos_m = self.mutacao_aleatbit(filhos)
+        
+        self.popAvaliada = self.pop
+        self.pop = filhos_m
+        self.geracao += 1
+
+
+    def run(self):
+        '''
+        Executa as gerações restantes até n_geracoes ou até um critério de parada ser atingido.
+        No GA a geração avalia a população antes de criar os filhos, então a parada é verificada após cada passo.
+        '''
+        self.parada.inicia()
+        if self.perfil is not None: self.perfil.inicio()
+        self.motivo_parada = None
+        self.observador.inicio(self)
+
+        while self.geracao < self.n_geracoes:
+
+            self.step()
+
+            self.observador.geracao(self)
+            if self.checkpoint: self.checkpoint.verifica(self)
+
+            self.motivo_parada = self.parada.verifica(self.bestCusto, self.n_avaliacoes)
+            if self.motivo_parada: break
+
+        self.finaliza()
+
+        return self.get_best()
+
+
+    def get_pop(self):
+        '''
+        Retorna a população atual, desempacotada
+        '''
+        if self.empacotado:
+            return self.desempacota(self.pop)
+
+        return self.pop
+
+
+    def get_best(self):
+        '''
+        Retorna a melhor solução e seu respectivo custo
+        '''
+        return self.bestSol, self.bestCusto
+
+
+    def emigrantes(self, n):
+        '''
+        Retorna os n melhores indivíduos da última população avaliada (desempacotados) e seus custos
+        '''
+        melhores = np.argsort(self.custos)[:n]
+        cands = self.popAvaliada[melhores]
+
+        return (self.desempacota(cands) if self.empacotado else cands), self.custos[melhores]
+
+
+    def novos_individuos(self, n):
+        '''
+        Sorteia n indivíduos aleatórios no formato da população (binário, empacotado ou real)
+        '''
+        if self.real:
+            return self.popula(n)
+
+        if self.empacotado:
+            novos = self.rng.integers(0, 256, (n, self.nBytes), dtype=np.uint8)
+            novos[:, -1] &= self.mascara_ultimo_byte()
+            return novos
+
+        return self.rng.integers(0, 2, (n, self.nCrom))
+
+
+    def reinicia(self, fracao, n_elite=1):
+        '''
+        Substitui a fração "fracao" da população atual (ainda não avaliada) por indivíduos aleatórios.
+        Como o GA guarda apenas a melhor solução, n_elite > 0 reinsere bestSol na população.
+        '''
+        n = min(int(round(fracao*self.nInd)), self.nInd)
+        if n <= 0: return
+
+        pos = self.rng.choice(self.nInd, n, replace=False)
+        self.pop[pos] = self.novos_individuos(n)
+
+        if n_elite and self.bestSol is not None:
+            self.pop[pos[0]] = np.packbits(self.bestSol.astype(np.uint8)) if self.empacotado else self.bestSol
+
+
+    def recebe_imigrantes(self, cands, custos):
+        '''
+        Substitui indivíduos sorteados da população atual pelos imigrantes (cromossomos desempacotados).
+        Os imigrantes são reavaliados na próxima geração junto com os demais.
+        '''
+        if self.empacotado:
+            cands = np.packbits(np.asarray(cands, dtype=np.uint8), axis=-1)
+        else:
+            cands = np.asarray(cands, dtype=self.pop.dtype)
+
+        pos = self.rng.choice(self.nInd, len(cands), replace=False)
+        self.pop[pos] = cands
+
+        melhor = np.argmin(custos)
+        if custos[melhor] < self.bestCusto:
+            self.bestCusto = custos[melhor]
+            self.bestSol = self.desempacota(cands[melhor]) if self.empacotado else cands[melhor]
@@ -0,0 +1,142 @@
+import asyncio
+import inspect
+import time
+from collections import deque
+
+import numpy as np
+
+
+class ExecucaoAssincrona(object):
+
+    def __init__(self, otim, f_custo=None, max_simultaneas=8):
+        '''
+        Execução em estado estacionário (steady-state) com asyncio, para funções custo limitadas por I/O
+        (por exemplo, chamadas a um serviço de simulação pela rede). Até max_simultaneas avaliações ficam em
+        andamento ao mesmo tempo, e cada resultado é aplicado ao otimizador assim que chega: o indivíduo
+        correspondente é atualizado e um novo candidato é criado para ele a partir da população atual.
+        otim: Otimizador com os métodos propoe_individuo(i) e aceita_individuo(i, cand, custo) (ED e PSO),
+              construído com executar=False
+        f_custo: Função custo "async def f(x)" de um candidato (dim,). Também aceita funções comuns, executadas
+                 em threads. Por padrão, a função custo do otimizador
+        max_simultaneas: Número máximo de avaliações em andamento (limitado ao tamanho da população)
+
+        Cada conjunto de avaliações do tamanho da população conta como uma geração: o orçamento é o número de
+        gerações do otimizador, e observadores, checkpoint e critérios de parada são verificados a cada geração.
+        '''
+        self.otim = otim
+        self.f_custo = f_custo or otim.f_custo
+        self.max_simultaneas = max_simultaneas
+
+        # Funções "async def" ou objetos com "async def __call__"
+        self.corrotina = inspect.iscoroutinefunction(self.f_custo) or inspect.iscoroutinefunction(getattr(self.f_custo, '__call__', None))
+
+
+    async def avalia(self, cand):
+        '''
+        Avalia um candidato, aguardando a função custo assíncrona ou executando a função comum em uma thread.
+        Com perfil, a duração de cada avaliação é somada em 'avalia_assincrona' (avaliações simultâneas se sobrepõem,
+        então a soma pode passar do tempo total)
+        '''
+        t0 = time.perf_counter()
+
+        if self.corrotina:
+            custo = await self.f_custo(cand)
+        else:
+            custo = await asyncio.to_thread(self.f_custo, cand)
+
+        if self.otim.perfil is not None: self.otim.perfil.acumula('avalia_assincrona', time.perf_counter() - t0)
+
+        return float(custo)
+
+
+    async def avalia_lote(self, cands):
+        '''
+        Avalia todos os candidatos de uma matriz, com até max_simultaneas avaliações em andamento
+        '''
+        limite = asyncio.Semaphore(self.max_simultaneas)
+
+        async def avalia_limitado(cand):
+            async with limite:
+                return await self.avalia(cand)
+
+        custos = await asyncio.gather(*[avalia_limitado(c) for c in cands])
+        self.otim.n_avaliacoes += len(cands)
+
+        return np.array(custos, dtype=float)
+
+
+    def fim_geracao(self):
+        '''
+        Conclui uma geração: observadores, checkpoint e critérios de parada
+        '''
+        otim = self.otim
+
+        otim.geracao += 1
+        otim.observador.geracao(otim)
+        if otim.checkpoint: otim.checkpoint.verifica(otim)
+
+        if otim.motivo_parada is None:
+            otim.motivo_parada = otim.parada.verifica(otim.get_best()[1], otim.n_avaliacoes)
+
+
+    async def executa(self):
+        '''
+        Corrotina da otimização: avalia a população inicial, se necessário, e mantém as avaliações em andamento
+        até o fim das gerações ou até um critério de parada. Retorna a melhor solução e seu custo.
+        '''
+        otim = self.otim
+        otim.parada.inicia()
+        if otim.perfil is not None: otim.perfil.inicio()
+
+        if not otim.iniciado:
+            otim.recebe_custos(await self.avalia_lote(otim.ask()))
+
+        otim.motivo_parada = None
+        otim.observador.inicio(otim)
+
+        n_pop = len(otim.get_pop())
+        restantes = otim.n_geracoes - otim.geracao
+        a_submeter = max(restantes, 0)*n_pop
+        concluidas = 0
+
+        livres = deque(range(n_pop))    # Indivíduos sem avaliação em andamento
+        pendentes = {}                  # Tarefa -> (indivíduo, candidato)
+
+        try:
+            while True:
+                while livres and len(pendentes) < self.max_simultaneas and a_submeter and otim.motivo_parada is None:
+                    i = livres.popleft()
+                    cand = otim.propoe_individuo(i)
+                    pendentes[asyncio.ensure_future(self.avalia(cand))] = (i, cand)
+                    a_submeter -= 1
+
+                if not pendentes: break
+
+                prontas, _ = await asyncio.wait(pendentes, return_when=asyncio.FIRST_COMPLETED)
+
+                for tarefa in prontas:
+                    i, cand = pendentes.pop(tarefa)
+                    otim.aceita_individuo(i, cand, tarefa.result())
+                    otim.n_avaliacoes += 1
+                    livres.append(i)
+
+                    concluidas += 1
+                    if concluidas % n_pop == 0:
+                        self.fim_geracao()
+
+        finally:
+            for tarefa in pendentes:
+                tarefa.cancel()
+
+        if otim.perfil is not None: otim.perfil.fim(otim)
+        otim.observador.fim(otim)
+
+        return otim.get_best()
+
+
+    def run(self):
+        '''
+        Executa a otimização em um novo loop de eventos (asyncio.run). Dentro de um loop já em execução, use
+        "await executa()".
+        '''
+        return asyncio.run(self.executa())
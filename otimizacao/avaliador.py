@@ -0,0 +1,211 @@
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+
+def avalia_bloco(f_custo, bloco, vectorized):
+    '''
+    Avalia um bloco de soluções candidatas e retorna o vetor de custos.
+    É a função executada em cada worker, por isso fica no nível do módulo (precisa ser serializável).
+    '''
+    if vectorized:
+        return np.asarray(f_custo(bloco), dtype=float).reshape(len(bloco))
+
+    return np.array([f_custo(c) for c in bloco], dtype=float)
+
+
+# Bloco de memória compartilhada anexado em cada worker do AvaliadorCompartilhado: {nome: SharedMemory}
+BLOCOS_ANEXADOS = {}
+
+
+def vetores_bloco(buf, n, dim, dtype):
+    '''
+    Visões (candidatos, custos) sobre o buffer de um bloco compartilhado: n linhas de dim colunas do tipo
+    dtype, seguidas dos n custos em float64 (alinhados em 8 bytes)
+    '''
+    tam_cands = n*dim*np.dtype(dtype).itemsize
+    cands = np.ndarray((n, dim), dtype=dtype, buffer=buf)
+    custos = np.ndarray(n, dtype=float, buffer=buf, offset=-(-tam_cands//8)*8)
+    return cands, custos
+
+
+def avalia_intervalo(f_custo, nome, n, dim, dtype, inicio, fim, vectorized):
+    '''
+    Avalia, dentro de um worker, as linhas [inicio, fim) do bloco compartilhado "nome", escrevendo os custos
+    no próprio bloco. Só os limites do intervalo trafegam entre os processos, não os candidatos.
+    '''
+    if nome not in BLOCOS_ANEXADOS:
+        for bloco in BLOCOS_ANEXADOS.values():
+            bloco.close()
+        BLOCOS_ANEXADOS.clear()
+        BLOCOS_ANEXADOS[nome] = shared_memory.SharedMemory(name=nome)
+
+    cands, custos = vetores_bloco(BLOCOS_ANEXADOS[nome].buf, n, dim, dtype)
+    custos[inicio:fim] = avalia_bloco(f_custo, cands[inicio:fim], vectorized)
+
+
+class AvaliadorSerial(object):
+
+    paralelo = False
+
+    def avalia(self, f_custo, cands, vectorized=False):
+        '''
+        Avalia todos os candidatos no processo atual
+        '''
+        return avalia_bloco(f_custo, cands, vectorized)
+
+
+    def fecha(self):
+        pass
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.fecha()
+
+
+class AvaliadorPool(AvaliadorSerial):
+
+    paralelo = True
+
+    def __init__(self, n_workers=None, tam_bloco=None):
+        '''
+        Avaliação em paralelo através de um pool do concurrent.futures.
+        n_workers: Número de workers. Por padrão, o número de CPUs
+        tam_bloco: Número de candidatos enviados por tarefa. Por padrão, divide os candidatos em 4 blocos por worker
+
+        O pool é criado na primeira avaliação e mantido vivo entre as gerações, até a chamada de fecha().
+        '''
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.tam_bloco = tam_bloco
+        self.pool = None
+
+
+    def cria_pool(self):
+        raise NotImplementedError
+
+
+    def blocos(self, n):
+        '''
+        Limites (inicio, fim) dos blocos de candidatos enviados a cada tarefa
+        '''
+        tam = self.tam_bloco or max(1, -(-n//(4*self.n_workers)))
+        return [(i, min(i+tam, n)) for i in range(0, n, tam)]
+
+
+    def avalia(self, f_custo, cands, vectorized=False):
+        '''
+        Divide os candidatos em blocos e avalia os blocos em paralelo, mantendo a ordem dos custos
+        '''
+        if self.pool is None:
+            self.pool = self.cria_pool()
+
+        futuros = [self.pool.submit(avalia_bloco, f_custo, cands[i:f], vectorized) for i, f in self.blocos(len(cands))]
+
+        return np.concatenate([fut.result() for fut in futuros]) if futuros else np.zeros(0)
+
+
+    def fecha(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+
+class AvaliadorThreads(AvaliadorPool):
+    '''
+    Pool de threads: indicado para funções custo que liberam o GIL (NumPy, I/O, bibliotecas em C)
+    '''
+
+    def cria_pool(self):
+        return ThreadPoolExecutor(max_workers=self.n_workers)
+
+
+class AvaliadorProcessos(AvaliadorPool):
+    '''
+    Pool de processos: indicado para funções custo caras em Python puro. A função custo precisa ser
+    serializável (definida no nível de um módulo).
+    '''
+
+    def cria_pool(self):
+        return ProcessPoolExecutor(max_workers=self.n_workers)
+
+
+class AvaliadorCompartilhado(AvaliadorProcessos):
+
+    def __init__(self, n_workers=None, tam_bloco=None):
+        '''
+        Pool de processos em que os candidatos e os custos ficam em um bloco de multiprocessing.shared_memory.
+        Cada tarefa recebe apenas os limites do seu intervalo de linhas: os workers leem os candidatos e
+        escrevem os custos diretamente no bloco, evitando serializar a matriz da população a cada geração.
+        O bloco é realocado (com folga) apenas quando a população não cabe mais nele.
+        '''
+        AvaliadorProcessos.__init__(self, n_workers, tam_bloco)
+        self.shm = None
+
+
+    def prepara_bloco(self, n, dim, dtype):
+        '''
+        Garante um bloco compartilhado com espaço para n candidatos de dim colunas e seus custos
+        '''
+        tam = -(-n*dim*np.dtype(dtype).itemsize//8)*8 + 8*n
+        if self.shm is None or self.shm.size < tam:
+            self.libera_bloco()
+            self.shm = shared_memory.SharedMemory(create=True, size=max(tam, 1))
+
+        return vetores_bloco(self.shm.buf, n, dim, dtype)
+
+
+    def libera_bloco(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+    def avalia(self, f_custo, cands, vectorized=False):
+        '''
+        Copia os candidatos para o bloco compartilhado e avalia os intervalos de linhas em paralelo
+        '''
+        cands = np.asarray(cands)
+        n, dim = cands.shape
+
+        if self.pool is None:
+            self.pool = self.cria_pool()
+
+        cands_shm, custos_shm = self.prepara_bloco(n, dim, cands.dtype)
+        cands_shm[...] = cands
+
+        futuros = [self.pool.submit(avalia_intervalo, f_custo, self.shm.name, n, dim, cands.dtype.str, i, f, vectorized)
+                   for i, f in self.blocos(n)]
+        for fut in futuros:
+            fut.result()
+
+        return custos_shm.copy()
+
+
+    def fecha(self):
+        AvaliadorProcessos.fecha(self)
+        self.libera_bloco()
+
+
+def cria_avaliador(avaliador=None, **kwargs):
+    '''
+    Retorna o avaliador a partir do seu nome ('serial', 'threads', 'processos' ou 'compartilhado'), ou o próprio
+    objeto caso já seja um avaliador. Os kwargs (n_workers, tam_bloco) são repassados aos avaliadores em pool.
+    '''
+    if avaliador is None or avaliador == 'serial':
+        return AvaliadorSerial()
+    if avaliador == 'threads':
+        return AvaliadorThreads(**kwargs)
+    if avaliador == 'processos':
+        return AvaliadorProcessos(**kwargs)
+    if avaliador == 'compartilhado':
+        return AvaliadorCompartilhado(**kwargs)
+    if isinstance(avaliador, str):
+        raise ValueError("Avaliador desconhecido: {}".format(avaliador))
+
+    return avaliador
@@ -0,0 +1,108 @@
+import os
+import json
+import numpy as np
+
+
+def estado_objeto(obj, prefixo=''):
+    '''
+    Pares (nome, valor) do estado de "obj": os atributos listados em obj.atributos_estado e, recursivamente,
+    o estado dos objetos listados em obj.componentes_estado (adaptação, surrogato...), com nomes "componente.atributo"
+    '''
+    for nome in obj.atributos_estado:
+        yield prefixo + nome, getattr(obj, nome)
+
+    for nome in getattr(obj, 'componentes_estado', ()):
+        componente = getattr(obj, nome)
+        if componente is not None:
+            yield from estado_objeto(componente, prefixo + nome + '.')
+
+
+def restaura_objeto(obj, dados, prefixo=''):
+    '''
+    Restaura em "obj" e em seus componentes os atributos presentes em "dados" (gerados por estado_objeto)
+    '''
+    for nome in obj.atributos_estado:
+        if prefixo + nome in dados:
+            valor = dados[prefixo + nome]
+            setattr(obj, nome, valor.item() if valor.ndim == 0 else valor)
+
+    for nome in getattr(obj, 'componentes_estado', ()):
+        componente = getattr(obj, nome)
+        if componente is not None:
+            restaura_objeto(componente, dados, prefixo + nome + '.')
+
+
+def salva_estado(otim, caminho, comprimido=False):
+    '''
+    Salva o estado do otimizador (atributos listados em otim.atributos_estado, estado de seus componentes,
+    como a adaptação da ED e o arquivo do surrogato, e o estado do gerador aleatório) em um arquivo .npz. A escrita é atômica: o arquivo é gravado em um temporário no mesmo
+    diretório e só então substitui o anterior, então uma interrupção nunca deixa um checkpoint corrompido.
+    comprimido: Usa np.savez_compressed (menor, porém bem mais lento para populações grandes)
+    '''
+    arrays = {}
+    for nome, valor in estado_objeto(otim):
+        if valor is not None:      # Atributos ainda não inicializados não são salvos
+            arrays[nome] = np.asarray(valor)
+
+    # Os estados de MT19937, SFC64 e Philox contêm arrays, gravados como listas (os setters aceitam listas)
+    arrays['rng_estado'] = np.array(json.dumps(otim.rng.bit_generator.state, default=lambda a: a.tolist()))
+
+    tmp = caminho + '.tmp'
+    with open(tmp, 'wb') as arq:
+        if comprimido:
+            np.savez_compressed(arq, **arrays)
+        else:
+            np.savez(arq, **arrays)
+        arq.flush()
+        os.fsync(arq.fileno())
+
+    os.replace(tmp, caminho)
+
+
+def carrega_estado(otim, caminho):
+    '''
+    Restaura no otimizador o estado salvo por salva_estado(). O otimizador deve ter sido construído com os
+    mesmos parâmetros e executar=False; em seguida, run() continua a partir da geração salva.
+    '''
+    with np.load(caminho, allow_pickle=False) as dados:
+        restaura_objeto(otim, dados)
+        otim.rng.bit_generator.state = json.loads(dados['rng_estado'].item())
+
+    return otim
+
+
+class Checkpoint(object):
+
+    def __init__(self, caminho, intervalo=1, comprimido=False):
+        '''
+        Checkpoint periódico, passado aos otimizadores pelo parâmetro "checkpoint".
+        caminho: Arquivo .npz de destino (sobrescrito a cada checkpoint)
+        intervalo: Salva a cada "intervalo" gerações concluídas
+        comprimido: Usa compressão zip (np.savez_compressed)
+        '''
+        self.caminho = caminho
+        self.intervalo = intervalo
+        self.comprimido = comprimido
+
+
+    def verifica(self, otim):
+        '''
+        Chamado ao fim de cada geração: salva o estado se a geração atual for múltipla do intervalo
+        '''
+        if otim.geracao % self.intervalo == 0:
+            self.salva(otim)
+
+
+    def salva(self, otim):
+        salva_estado(otim, self.caminho, self.comprimido)
+
+
+    def carrega(self, otim):
+        '''
+        Restaura o otimizador a partir do último checkpoint, se o arquivo existir. Retorna True se restaurou.
+        '''
+        if not os.path.exists(self.caminho):
+            return False
+
+        carrega_estado(otim, self.caminho)
+        return True
@@ -0,0 +1,80 @@
+import numpy as np
+
+from .observadores import ObservadorNulo
+
+
+def distancia_centroide(pop):
+    '''
+    Distância euclidiana média das soluções candidatas ao centroide da população
+    '''
+    return float(np.mean(np.linalg.norm(pop - pop.mean(axis=0), axis=1)))
+
+
+def variancia_genes(pop):
+    '''
+    Variância de cada gene/variável na população, vetor (dim,)
+    '''
+    return np.var(pop, axis=0)
+
+
+def variancia_media(pop):
+    '''
+    Média das variâncias por gene
+    '''
+    return float(np.mean(variancia_genes(pop)))
+
+
+def entropia_bits(pop):
+    '''
+    Entropia média (em bits, entre 0 e 1) de cada gene de uma população binária 0/1. Vale 0 quando todos os
+    indivíduos são iguais e 1 quando cada gene está dividido igualmente entre 0 e 1.
+    '''
+    p = np.mean(pop, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h = -(p*np.log2(p) + (1-p)*np.log2(1-p))
+
+    return float(np.mean(np.nan_to_num(h)))
+
+
+class Reinicio(ObservadorNulo):
+
+    def __init__(self, limiar=0.05, medida=distancia_centroide, fracao=0.8, n_elite=1, min_geracoes=10):
+        '''
+        Política de reinício por perda de diversidade, usada como observador de qualquer otimizador.
+        A cada geração mede a diversidade da população (get_pop()) e, quando ela cai abaixo de "limiar" vezes
+        a diversidade da população inicial, chama otim.reinicia(fracao, n_elite), que substitui parte da
+        população por novas soluções aleatórias mantendo as n_elite melhores.
+        limiar: Fração da diversidade inicial abaixo da qual a população é considerada colapsada
+        medida: Função de diversidade da população: distancia_centroide, variancia_media, entropia_bits (GA binário)...
+        fracao: Fração da população substituída em cada reinício
+        n_elite: Número de melhores soluções preservadas
+        min_geracoes: Número mínimo de gerações entre reinícios
+        '''
+        self.limiar = limiar
+        self.medida = medida
+        self.fracao = fracao
+        self.n_elite = n_elite
+        self.min_geracoes = min_geracoes
+
+        self.referencia = None
+        self.ultimo = 0
+        self.n_reinicios = 0
+        self.diversidade = None
+
+
+    def inicio(self, otim):
+        if self.referencia is None:
+            self.referencia = self.medida(otim.get_pop())
+            self.ultimo = otim.geracao
+
+
+    def geracao(self, otim):
+        self.diversidade = self.medida(otim.get_pop())
+
+        if otim.geracao - self.ultimo < self.min_geracoes:
+            return
+
+        if self.diversidade < self.limiar*self.referencia:
+            otim.reinicia(self.fracao, self.n_elite)
+            self.ultimo = otim.geracao
+            self.n_reinicios += 1
@@ -0,0 +1,210 @@
+import numpy as np
+
+from .otimizador import Otimizador
+from .kernels import experimentais_ed
+from .limites import Corte95
+from .adaptacao import cria_adaptacao
+
+
+def sorteia_distintos(rng, alvos, tam_pop, k):
+	'''
+	Sorteia, para cada índice em "alvos", k índices em [0, tam_pop) diferentes entre si e do próprio alvo.
+	Cada sorteio é feito entre as posições restantes e deslocado para pular os índices já excluídos.
+	'''
+	excluidos = alvos[:, np.newaxis]
+
+	for j in range(k):
+		r = rng.integers(0, tam_pop - (j+1), len(alvos))
+
+		# Percorrendo os excluídos em ordem crescente, cada um menor ou igual ao sorteio o desloca em uma posição
+		for ex in np.sort(excluidos, axis=1).T:
+			r += r >= ex
+
+		excluidos = np.column_stack((excluidos, r))
+
+	return excluidos[:, 1:]
+
+
+class ED(Otimizador):
+
+	atributos_estado = ('vet_cand', 'vet_cust', 'F', 'best_indiv', 'best_custo', 'iniciado', 'geracao', 'n_avaliacoes')
+	componentes_estado = Otimizador.componentes_estado + ('adaptacao',)
+	atributos_pop = ('vet_cand', 'vet_cust', 'best_indiv', 'best_custo')
+	operadores_perfil = Otimizador.operadores_perfil + ('gera_experimentais', 'geracao_assincrona', 'propoe_individuo', 'aceita_individuo')
+		
+	def __init__(self, tam_pop, dim, n_ger, prob_mut, min_vals, max_vals, f_custo, vectorized=False, avaliador=None, sincrono=None, seed=None, parada=None, checkpoint=None, verbose=False, observador=None, estrategia_limites='corte95', surrogato=None, adaptacao=None, perfil=None, executar=True):
+		
+		'''
+		ED: Evolução diferencial
+		tam_pop: Número de soluções candidatas
+		dim: Dimensão do problema de otimização	
+		n_ger: Número de gerações/iterações da otimização
+		prob_mut: Probabilidade de mutação
+		min_vals: Limite inferior das soluções candidatas a otimização
+		max_vals: Limite superior das soluções candidatas a otimização
+		f_custo: Função custo
+		vectorized: Se True, a função custo recebe a matriz de candidatos (n, dim) e retorna o vetor de custos (n,).
+		avaliador: Backend de avaliação: 'serial', 'threads', 'processos', 'compartilhado' ou um objeto do módulo avaliador
+		sincrono: Se True, a geração é síncrona: todos os vetores experimentais são criados a partir da população
+				  atual e avaliados de uma vez. Por padrão é síncrona no modo vetorizado ou com avaliador paralelo.
+		seed: Semente (int ou SeedSequence) ou np.random.Generator usado em todos os sorteios desta instância
+		parada: Objeto CriterioParada com critérios de parada antecipada (custo alvo, estagnação, tempo, avaliações)
+		checkpoint: Objeto Checkpoint para salvar o estado periodicamente (ver checkpoint.py)
+		verbose: Se True e nenhum observador for dado, imprime o melhor custo a cada geração
+		observador: Observador (ou lista de observadores) chamado a cada geração (ver observadores.py). Por padrão, silencioso
+		estrategia_limites: Estratégia de limites: 'corte', 'corte95', 'fator95', 'reflexao', 'reamostragem', 'ponto_medio' ou um objeto do módulo limites. Por padrão, 'corte95'
+		surrogato: Objeto PreSelecao (ver surrogato.py): só os candidatos mais promissores segundo um modelo substituto são avaliados pela função custo
+		adaptacao: Adaptação de F e da probabilidade de cruzamento por indivíduo: 'jde', 'shade' ou um objeto do módulo
+				   adaptacao. Por padrão (None), F é sorteado uma vez por execução e prob_mut é fixa
+		perfil: Se True (ou um objeto Perfil, ver perfil.py), acumula o tempo e as chamadas de cada operador; veja relatorio_perfil()
+		executar: Se True, a otimização é executada já na construção. Caso contrário, use run(), step() ou ask()/tell()
+		'''
+		
+		Otimizador.__init__(self, f_custo, dim, n_ger, min_vals, max_vals, vectorized, avaliador, sincrono, seed, parada, checkpoint, verbose, observador, estrategia_limites, surrogato, perfil)
+
+		self.tam_pop = tam_pop		# Tamanho da população
+		self.prob_mut = prob_mut        # Probabilidade de mutação
+		self.adaptacao = cria_adaptacao(adaptacao)
+		if self.adaptacao is not None: self.adaptacao.inicia(tam_pop)
+
+		self.experimentais = None       # Vetores experimentais aguardando custos em tell()
+		
+		self.F = self.rng.random()
+		self.best_indiv = None
+		self.best_custo = None
+
+		self.vet_cand = np.zeros((self.tam_pop, self.dim))	# Vetor da população - soluções candidatas
+		self.vet_cust = np.ones(tam_pop)			# Vetor de custos da população
+
+		if executar: self.run()      # Dá inicio à otimização
+
+
+	def ask(self):
+		'''
+		Retorna a matriz de candidatos a serem avaliados: a população inicial na primeira chamada e, depois,
+		os vetores experimentais de toda a população (geração síncrona). Os custos devem ser informados em
+		tell() na mesma ordem.
+		'''
+		if not self.iniciado:
+			self.vet_cand = self.popula(self.tam_pop)
+			return self.vet_cand
+
+		self.experimentais = self.gera_experimentais()
+		return self.experimentais
+
+
+	def recebe_custos(self, custos):
+		'''
+		Recebe os custos dos candidatos retornados por ask() e faz a seleção gulosa para a população inteira
+		'''
+		custos = np.asarray(custos, dtype=float)
+
+		if not self.iniciado:
+			self.vet_cust = custos
+			self.iniciado = True
+		else:
+			melhora = custos < self.vet_cust
+			if self.adaptacao is not None: self.adaptacao.registra(np.arange(self.tam_pop), melhora, self.vet_cust - custos)
+			self.vet_cand[melhora] = self.experimentais[melhora]
+			self.vet_cust[melhora] = custos[melhora]
+			self.experimentais = None
+			self.geracao += 1
+
+		self.atualiza_best()
+
+
+	def step(self):
+		'''
+		Executa uma geração (inicializando a população se necessário)
+		'''
+		if not self.iniciado:
+			self.inicializa()
+
+		if self.sincrono:
+			# Geração síncrona: todos os experimentais são criados a partir da população atual e avaliados juntos
+			self.recebe_custos(self.avalia_triagem(self.ask(), self.vet_cust))
+		else:
+			self.geracao_assincrona()
+			self.geracao += 1
+			self.atualiza_best()
+
+
+	def geracao_assincrona(self):
+		'''
+		Geração assíncrona: cada indivíduo substituído já participa da mutação dos indivíduos seguintes
+		'''
+		for i in range(self.tam_pop):
+
+			new_indiv = self.propoe_individuo(i)
+
+			new_cust = self.avalia_triagem(new_indiv[np.newaxis], self.vet_cust[i:i+1])[0] # Custo do novo indivíduo mutado
+
+			self.aceita_individuo(i, new_indiv, new_cust)
+
+
+	def propoe_individuo(self, i):
+		'''
+		Vetor experimental do indivíduo i, criado a partir da população atual
+		'''
+		return self.gera_experimentais(np.array([i]))[0]
+
+
+	def aceita_individuo(self, i, cand, custo):
+		'''
+		Seleção gulosa entre o indivíduo i e seu vetor experimental "cand", atualizando a melhor solução
+		'''
+		if self.adaptacao is not None: self.adaptacao.registra([i], [custo < self.vet_cust[i]], [self.vet_cust[i] - custo])
+
+		if custo < self.vet_cust[i]:
+			self.vet_cand[i] = cand
+			self.vet_cust[i] = custo
+
+			if custo < self.best_custo:
+				self.best_indiv = cand.copy()
+				self.best_custo = custo
+
+
+	def sorteia_indices(self, alvos):
+		'''
+		Sorteia, para cada índice em "alvos", 3 índices da população diferentes entre si e do próprio alvo
+		'''
+		return sorteia_distintos(self.rng, alvos, self.tam_pop, 3)
+
+
+	def parametros(self, alvos):
+		'''
+		F e probabilidade de cruzamento dos vetores experimentais dos "alvos": os valores fixos da execução ou,
+		com adaptação, os sorteados para cada alvo
+		'''
+		if self.adaptacao is None:
+			return self.F, self.prob_mut
+
+		F, CR = self.adaptacao.sorteia(alvos, self.rng)
+		return F, CR[:, np.newaxis]
+
+
+	def gera_experimentais(self, alvos=None):
+		'''
+		Cria os vetores experimentais (DE/rand/1/bin) dos indivíduos em "alvos" (por padrão, toda a população)
+		a partir da população atual. Retorna a matriz (len(alvos), dim).
+		'''
+		if alvos is None: alvos = np.arange(self.tam_pop)
+
+		# Selecionando 3 indivíduos aleatórios e diferentes entre si e do alvo
+		r = self.sorteia_indices(alvos)
+
+		F, prob_mut = self.parametros(alvos)
+
+		# Cruzamento binomial: cada característica vem do mutante com probabilidade prob_mut,
+		# e uma posição aleatória por indivíduo vem sempre do mutante
+		mascara = self.rng.random((len(alvos), self.dim)) <= prob_mut
+		pos_aleat_caract = self.rng.integers(0, self.dim, len(alvos))
+		mascara[np.arange(len(alvos)), pos_aleat_caract] = True
+
+		# Mutante, cruzamento e limitação em um único passo (ver kernels.py). O kernel já aplica a estratégia
+		# 'corte95'; as demais são aplicadas em seguida sobre os vetores sem limitação
+		if isinstance(self.limites, Corte95):
+			return experimentais_ed(self.vet_cand, alvos, r, F, mascara, self.lim_inf, self.lim_sup)
+
+		experimentais = experimentais_ed(self.vet_cand, alvos, r, F, mascara, -np.inf, np.inf)
+		return self.limita_cands(experimentais, self.vet_cand[alvos])
@@ -0,0 +1,189 @@
+import os
+import threading
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .aleatorio import gera_rngs
+from .observadores import ObservadorNulo, ObservadorComposto
+
+
+def origens_migracao(indice, n_ilhas, topologia):
+    '''
+    Ilhas das quais a ilha "indice" recebe imigrantes: a anterior no anel ('anel') ou todas as demais ('completa')
+    '''
+    if topologia == 'anel':
+        return [(indice - 1) % n_ilhas]
+    if topologia == 'completa':
+        return [i for i in range(n_ilhas) if i != indice]
+
+    raise ValueError("Topologia desconhecida: {}".format(topologia))
+
+
+class Migracao(ObservadorNulo):
+
+    def __init__(self, indice, n_ilhas, intervalo, n_migrantes, topologia, nome_shm, largura, barreira):
+        '''
+        Observador instalado em cada ilha que, a cada "intervalo" gerações, publica os melhores indivíduos
+        da ilha na memória compartilhada e recebe os melhores indivíduos das ilhas de origem.
+        A memória compartilhada guarda, para cada ilha, n_migrantes linhas de largura "largura" e seus custos.
+        '''
+        self.indice = indice
+        self.intervalo = intervalo
+        self.n_migrantes = n_migrantes
+        self.origens = origens_migracao(indice, n_ilhas, topologia)
+        self.barreira = barreira
+        self.ativa = n_ilhas > 1
+
+        self.shm = shared_memory.SharedMemory(name=nome_shm)
+        n_cands = n_ilhas*n_migrantes*largura
+        self.cands = np.ndarray((n_ilhas, n_migrantes, largura), dtype=float, buffer=self.shm.buf)
+        self.custos = np.ndarray((n_ilhas, n_migrantes), dtype=float, buffer=self.shm.buf, offset=8*n_cands)
+
+
+    def geracao(self, otim):
+        if not self.ativa or otim.geracao % self.intervalo != 0:
+            return
+
+        cands, custos = otim.emigrantes(self.n_migrantes)
+        n = len(custos)
+        self.cands[self.indice, :n] = cands
+        self.custos[self.indice, :n] = custos
+        self.custos[self.indice, n:] = np.inf  # População menor que n_migrantes: posições vazias
+
+        try:
+            # Todas as ilhas publicaram seus emigrantes
+            self.barreira.wait()
+        except threading.BrokenBarrierError:
+            self.ativa = False  # Alguma ilha terminou antes (critério de parada ou erro): segue isolada
+            return
+
+        recebidos = self.cands[self.origens].reshape(-1, self.cands.shape[-1]).copy()
+        custos_recebidos = self.custos[self.origens].ravel().copy()
+
+        try:
+            # Todas as ilhas copiaram os imigrantes antes da próxima escrita
+            self.barreira.wait()
+        except threading.BrokenBarrierError:
+            self.ativa = False
+
+        melhores = np.argsort(custos_recebidos)[:self.n_migrantes]
+        melhores = melhores[np.isfinite(custos_recebidos[melhores])]
+        if len(melhores):
+            otim.recebe_imigrantes(recebidos[melhores], custos_recebidos[melhores])
+
+
+    def fim(self, otim):
+        # Uma ilha que para antes das demais libera as que ainda esperariam por ela na barreira
+        if otim.motivo_parada is not None:
+            self.barreira.abort()
+
+        self.shm.close()
+
+
+def executa_ilha(indice, fabrica, seed, migracao, fila):
+    '''
+    Função executada em cada processo: constrói o otimizador da ilha, instala o observador de migração e
+    executa a otimização, devolvendo o resultado pela fila
+    '''
+    barreira = migracao[-1]
+    try:
+        otim = fabrica(seed=seed)
+        mig = Migracao(indice, *migracao)
+        otim.observador = ObservadorComposto([otim.observador, mig])
+
+        best, custo = otim.run()
+        fila.put((indice, best, custo, otim.n_avaliacoes, otim.geracao, otim.motivo_parada, None))
+
+    except Exception as erro:
+        barreira.abort()
+        fila.put((indice, None, np.inf, 0, 0, None, repr(erro)))
+
+
+class ModeloIlhas(object):
+
+    def __init__(self, fabrica, n_ilhas=None, intervalo=10, n_migrantes=1, topologia='anel', seed=None, executar=True):
+        '''
+        Modelo de ilhas: n_ilhas instâncias independentes de um otimizador, cada uma em seu processo,
+        trocando os melhores indivíduos a cada "intervalo" gerações.
+        fabrica: Função que recebe o argumento "seed" e retorna o otimizador da ilha construído com executar=False,
+                 por exemplo functools.partial(ED, 50, 10, 200, 0.9, lim_inf, lim_sup, f_custo, executar=False).
+                 Deve ser serializável (função custo definida no nível de um módulo).
+        n_ilhas: Número de ilhas (processos). Por padrão, o número de CPUs
+        intervalo: Número de gerações entre migrações
+        n_migrantes: Número de indivíduos enviados por cada ilha em cada migração
+        topologia: 'anel' (cada ilha recebe da anterior) ou 'completa' (recebe os melhores de todas as outras)
+        seed: Semente da qual são derivados geradores independentes para cada ilha
+
+        Todas as ilhas devem executar o mesmo número de gerações; uma ilha que para antes (por um CriterioParada)
+        encerra as migrações das demais, que seguem isoladas até o fim.
+        '''
+        self.fabrica = fabrica
+        self.n_ilhas = n_ilhas or os.cpu_count() or 1
+        self.intervalo = intervalo
+        self.n_migrantes = n_migrantes
+        self.topologia = topologia
+        self.seeds = gera_rngs(seed, self.n_ilhas)
+
+        origens_migracao(0, self.n_ilhas, topologia) # Valida a topologia antes de criar os processos
+
+        self.resultados = None
+        self.best = None
+        self.best_custo = np.inf
+
+        if executar: self.run()
+
+
+    def largura(self):
+        '''
+        Número de colunas de um indivíduo, obtido de uma instância de amostra (sem avaliar a função custo)
+        '''
+        amostra = self.fabrica(seed=0)
+        amostra.ask()
+        return amostra.get_pop().shape[1]
+
+
+    def run(self):
+        '''
+        Executa as ilhas em paralelo e retorna a melhor solução entre todas
+        '''
+        largura = self.largura()
+        n_cands = self.n_ilhas*self.n_migrantes*largura
+        shm = shared_memory.SharedMemory(create=True, size=8*(n_cands + self.n_ilhas*self.n_migrantes))
+
+        try:
+            barreira = mp.Barrier(self.n_ilhas)
+            fila = mp.Queue()
+            migracao = (self.n_ilhas, self.intervalo, self.n_migrantes, self.topologia, shm.name, largura, barreira)
+
+            processos = [mp.Process(target=executa_ilha, args=(i, self.fabrica, self.seeds[i], migracao, fila))
+                         for i in range(self.n_ilhas)]
+            for p in processos:
+                p.start()
+
+            # A fila é esvaziada antes do join, para que nenhum processo fique bloqueado ao enviar o resultado
+            resultados = [fila.get() for _ in processos]
+            for p in processos:
+                p.join()
+
+        finally:
+            shm.close()
+            shm.unlink()
+
+        self.resultados = sorted(resultados, key=lambda r: r[0])
+
+        erros = [r[-1] for r in self.resultados if r[-1] is not None]
+        if len(erros) == self.n_ilhas:
+            raise RuntimeError("Todas as ilhas falharam: {}".format(erros[0]))
+
+        _, self.best, self.best_custo, *_ = min(self.resultados, key=lambda r: r[2])
+
+        return self.get_best()
+
+
+    def get_best(self):
+        '''
+        Retorna a melhor solução e seu respectivo custo entre todas as ilhas
+        '''
+        return self.best, self.best_custo
@@ -0,0 +1,204 @@
+'''
+Kernels das atualizações internas dos otimizadores.
+
+Cada operação tem duas versões com resultados idênticos: um laço único compilado com Numba (sem arrays
+intermediários), usado automaticamente quando o Numba está instalado, e uma versão NumPy, usada como
+alternativa (in-place onde isso é mais rápido). Os sorteios continuam sendo feitos pelo gerador do otimizador, fora dos
+kernels, para que a sequência aleatória seja a mesma nas duas versões.
+'''
+import numpy as np
+
+try:
+    from numba import njit
+    TEM_NUMBA = True
+except ImportError:
+    TEM_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda f: f
+
+
+def limites_vetor(lim, dim):
+    '''
+    Limites como vetor float contíguo (dim,), aceitando escalares
+    '''
+    return np.ascontiguousarray(np.broadcast_to(np.asarray(lim, dtype=float), (dim,)))
+
+
+def limites_95(lim_inf, lim_sup):
+    '''
+    Limites contraídos a 95% em torno do centro c = (lim_inf + lim_sup)/2 do intervalo: c + 0.95*(lim - c), com
+    c = 0 nas variáveis sem limite finito. Ficam sempre dentro de [lim_inf, lim_sup] e, com limites simétricos
+    (c = 0), valem exatamente 0.95*lim_inf e 0.95*lim_sup.
+    '''
+    finito = np.isfinite(lim_inf) & np.isfinite(lim_sup)
+    c = np.zeros_like(lim_inf)
+    c[finito] = (lim_inf[finito] + lim_sup[finito])/2
+
+    return c + 0.95*(lim_inf - c), c + 0.95*(lim_sup - c)
+
+
+# ---------------------------------------------------------------------------------------------------------
+# Limitação a 95% dos limites (estratégia Fator95 e PSO síncrono)
+
+@njit(cache=True, nogil=True)
+def limita_95_jit(cand, lim_inf, lim_sup, inf_95, sup_95, out):
+    n, dim = cand.shape
+    for i in range(n):
+        for j in range(dim):
+            x = cand[i, j]
+            if x > lim_sup[j]:
+                x = sup_95[j]
+            elif x < lim_inf[j]:
+                x = inf_95[j]
+            out[i, j] = x
+
+
+def limita_95_numpy(cand, lim_inf, lim_sup, inf_95, sup_95, out):
+    acima, abaixo = cand > lim_sup, cand < lim_inf
+    np.copyto(out, cand)
+    np.copyto(out, sup_95, where=acima)
+    np.copyto(out, inf_95, where=abaixo)
+
+
+def limita_95(cand, lim_inf, lim_sup, out=None):
+    '''
+    Valores acima de lim_sup passam ao limite superior contraído a 95% e valores abaixo de lim_inf ao inferior
+    (ver limites_95). Aceita um candidato (dim,) ou uma matriz (n, dim); "out" pode ser o próprio "cand".
+    '''
+    cand = np.asarray(cand, dtype=float)
+    if out is None:
+        out = np.empty_like(cand)
+
+    dim = cand.shape[-1]
+    lim_inf, lim_sup = limites_vetor(lim_inf, dim), limites_vetor(lim_sup, dim)
+    inf_95, sup_95 = limites_95(lim_inf, lim_sup)
+
+    if TEM_NUMBA:
+        limita_95_jit(cand.reshape(-1, dim), lim_inf, lim_sup, inf_95, sup_95, out.reshape(-1, dim))
+    else:
+        limita_95_numpy(cand, lim_inf, lim_sup, inf_95, sup_95, out)
+
+    return out
+
+
+# ---------------------------------------------------------------------------------------------------------
+# Velocidade e posição do PSO síncrono
+
+@njit(cache=True, nogil=True)
+def atualiza_pso_jit(pop, v, p_best, g_best, r1, r2, w, c1, c2, lim_inf, lim_sup, inf_95, sup_95):
+    n, dim = pop.shape
+    for i in range(n):
+        for j in range(dim):
+            x = pop[i, j]
+            vij = w*v[i, j] + c1*r1[i, j]*(p_best[i, j] - x) + c2*r2[i, j]*(g_best[j] - x)
+            v[i, j] = vij
+
+            x = x + vij
+            if x > lim_sup[j]:
+                x = sup_95[j]
+            elif x < lim_inf[j]:
+                x = inf_95[j]
+            pop[i, j] = x
+
+
+def atualiza_pso_numpy(pop, v, p_best, g_best, r1, r2, w, c1, c2, lim_inf, lim_sup, inf_95, sup_95):
+    # Mesma ordem de operações do laço: w*v + (c1*r1)*(p_best - x) + (c2*r2)*(g_best - x)
+    v *= w
+
+    r1 *= c1
+    r1 *= p_best - pop
+    v += r1
+
+    r2 *= c2
+    r2 *= g_best - pop
+    v += r2
+
+    pop += v
+    limita_95_numpy(pop, lim_inf, lim_sup, inf_95, sup_95, pop)
+
+
+def atualiza_pso(pop, v, p_best, g_best, r1, r2, w, c1, c2, lim_inf, lim_sup):
+    '''
+    Atualiza in-place as velocidades "v" e as posições "pop" (n, dim) de todas as partículas, aplicando a
+    limitação a 95% dos limites (como a estratégia Fator95). r1 e r2 são os fatores aleatórios já sorteados (a versão NumPy os reutiliza
+    como áreas de trabalho).
+    '''
+    dim = pop.shape[1]
+    lim_inf, lim_sup = limites_vetor(lim_inf, dim), limites_vetor(lim_sup, dim)
+    inf_95, sup_95 = limites_95(lim_inf, lim_sup)
+
+    if TEM_NUMBA:
+        atualiza_pso_jit(pop, v, p_best, g_best, r1, r2, float(w), float(c1), float(c2), lim_inf, lim_sup, inf_95, sup_95)
+    else:
+        atualiza_pso_numpy(pop, v, p_best, g_best, r1, r2, w, c1, c2, lim_inf, lim_sup, inf_95, sup_95)
+
+
+# ---------------------------------------------------------------------------------------------------------
+# Vetores experimentais da ED (DE/rand/1/bin)
+
+@njit(cache=True, nogil=True)
+def experimentais_ed_jit(vet_cand, alvos, r, F, mascara, inf_95, sup_95, out):
+    n, dim = out.shape
+    for i in range(n):
+        a, b, c, alvo = r[i, 0], r[i, 1], r[i, 2], alvos[i]
+        for j in range(dim):
+            if mascara[i, j]:
+                x = vet_cand[a, j] + F[i]*(vet_cand[b, j] - vet_cand[c, j])
+            else:
+                x = vet_cand[alvo, j]
+            out[i, j] = min(max(x, inf_95[j]), sup_95[j])
+
+
+def experimentais_ed_numpy(vet_cand, alvos, r, F, mascara, inf_95, sup_95):
+    # Com indexação avançada, as versões in-place não são mais rápidas que as expressões diretas
+    mutantes = vet_cand[r[:, 0]] + F[:, np.newaxis]*(vet_cand[r[:, 1]] - vet_cand[r[:, 2]])
+    return np.clip(np.where(mascara, mutantes, vet_cand[alvos]), inf_95, sup_95)
+
+
+def experimentais_ed(vet_cand, alvos, r, F, mascara, lim_inf, lim_sup):
+    '''
+    Vetores experimentais dos "alvos": mutante r0 + F*(r1 - r2) nas posições marcadas em "mascara" e o próprio
+    alvo nas demais, limitados a 95% dos limites (como a estratégia Corte95). F é escalar ou um vetor com o F
+    de cada alvo. Retorna a matriz (len(alvos), dim).
+    '''
+    dim = vet_cand.shape[1]
+    inf_95, sup_95 = limites_95(limites_vetor(lim_inf, dim), limites_vetor(lim_sup, dim))
+    F = np.ascontiguousarray(np.broadcast_to(np.asarray(F, dtype=float), (len(alvos),)))
+
+    if not TEM_NUMBA:
+        return experimentais_ed_numpy(vet_cand, alvos, r, F, mascara, inf_95, sup_95)
+
+    out = np.empty((len(alvos), dim))
+    experimentais_ed_jit(vet_cand, alvos, r, F, mascara, inf_95, sup_95, out)
+
+    return out
+
+
+# ---------------------------------------------------------------------------------------------------------
+# Inversão de genes 0/1 do GA (mutação bit a bit não empacotada)
+
+@njit(cache=True, nogil=True)
+def inverte_genes_jit(filhos, mascara, out):
+    n, dim = filhos.shape
+    for i in range(n):
+        for j in range(dim):
+            out[i, j] = 1 - filhos[i, j] if mascara[i, j] else filhos[i, j]
+
+
+def inverte_genes_numpy(filhos, mascara, out):
+    np.bitwise_xor(filhos, mascara, out=out)
+
+
+def inverte_genes(filhos, mascara):
+    '''
+    Inverte (0 -> 1 e 1 -> 0) os genes marcados em "mascara", retornando uma nova matriz
+    '''
+    out = np.empty_like(filhos)
+
+    if TEM_NUMBA:
+        inverte_genes_jit(filhos, mascara, out)
+    else:
+        inverte_genes_numpy(filhos, mascara, out)
+
+    return out
@@ -0,0 +1,178 @@
+import numpy as np
+
+from .kernels import limita_95, limites_95, limites_vetor
+from .aleatorio import uniforme
+
+
+class EstrategiaLimites(object):
+    '''
+    Base das estratégias de tratamento de limites. aplica() recebe os candidatos (n, dim) ou (dim,) e retorna
+    uma nova matriz com todas as variáveis dentro de [lim_inf, lim_sup]. Estratégias com usa_pais = True
+    usam a solução de origem de cada candidato ("pais", mesmo shape); sem ela, recorrem ao corte nos limites.
+    '''
+
+    usa_pais = False
+
+    def aplica(self, cands, lim_inf, lim_sup, pais=None, rng=None):
+        raise NotImplementedError
+
+
+class Corte(EstrategiaLimites):
+    '''
+    Variáveis fora do intervalo são levadas ao limite violado
+    '''
+
+    def aplica(self, cands, lim_inf, lim_sup, pais=None, rng=None):
+        return np.clip(cands, lim_inf, lim_sup)
+
+
+class Corte95(EstrategiaLimites):
+    '''
+    Corte nos limites contraídos a 95% em torno do centro do intervalo (comportamento original da ED, que
+    cortava em 0.95*lim_inf e 0.95*lim_sup; idêntico com limites simétricos)
+    '''
+
+    def aplica(self, cands, lim_inf, lim_sup, pais=None, rng=None):
+        dim = np.shape(cands)[-1]
+        return np.clip(cands, *limites_95(limites_vetor(lim_inf, dim), limites_vetor(lim_sup, dim)))
+
+
+class Fator95(EstrategiaLimites):
+    '''
+    Variáveis acima do limite superior passam ao limite superior contraído a 95% em torno do centro do
+    intervalo, e abaixo do inferior ao inferior contraído (comportamento original do PSO e do TLBO, que
+    usavam 0.95*lim_sup e 0.95*lim_inf; idêntico com limites simétricos)
+    '''
+
+    def aplica(self, cands, lim_inf, lim_sup, pais=None, rng=None):
+        return limita_95(cands, lim_inf, lim_sup)
+
+
+class Reflexao(EstrategiaLimites):
+    '''
+    Variáveis fora do intervalo são refletidas nos limites (repetidamente, para violações maiores que a largura)
+    '''
+
+    def aplica(self, cands, lim_inf, lim_sup, pais=None, rng=None):
+        largura = lim_sup - lim_inf
+        fora = (cands < lim_inf) | (cands > lim_sup)
+
+        y = np.mod(cands - lim_inf, 2*largura)
+        refletido = lim_inf + np.where(y > largura, 2*largura - y, y)
+
+        return np.where(fora, refletido, cands)
+
+
+class Reamostragem(EstrategiaLimites):
+    '''
+    Variáveis fora do intervalo são sorteadas novamente, com distribuição uniforme entre os limites
+    '''
+
+    def aplica(self, cands, lim_inf, lim_sup, pais=None, rng=None):
+        fora = (cands < lim_inf) | (cands > lim_sup)
+        if not fora.any():
+            return np.array(cands, dtype=float)
+
+        aleat = uniforme(rng, lim_inf, lim_sup, np.shape(cands))
+        return np.where(fora, aleat, cands)
+
+
+class PontoMedio(EstrategiaLimites):
+    '''
+    Variáveis fora do intervalo passam ao ponto médio entre a solução de origem e o limite violado
+    '''
+
+    usa_pais = True
+
+    def aplica(self, cands, lim_inf, lim_sup, pais=None, rng=None):
+        if pais is None:
+            return np.clip(cands, lim_inf, lim_sup)
+
+        out = np.where(cands < lim_inf, (pais + lim_inf)/2, cands)
+        return np.where(cands > lim_sup, (pais + lim_sup)/2, out)
+
+
+ESTRATEGIAS = {
+    'corte': Corte,
+    'corte95': Corte95,
+    'fator95': Fator95,
+    'reflexao': Reflexao,
+    'reamostragem': Reamostragem,
+    'ponto_medio': PontoMedio,
+}
+
+
+def cria_estrategia(estrategia):
+    '''
+    Retorna a estratégia de limites a partir do seu nome ('corte', 'corte95', 'fator95', 'reflexao',
+    'reamostragem' ou 'ponto_medio'), ou o próprio objeto caso já seja uma estratégia
+    '''
+    if isinstance(estrategia, str):
+        if estrategia not in ESTRATEGIAS:
+            raise ValueError("Estratégia de limites desconhecida: {}".format(estrategia))
+        return ESTRATEGIAS[estrategia]()
+
+    return estrategia
+
+
+class Restricoes(object):
+
+    def __init__(self, f_custo, g, metodo='penalidade', peso=1e6, deslocamento=1e10):
+        '''
+        Envolve a função custo para problemas com restrições de desigualdade g(x) <= 0. A cada chamada, custo
+        e restrições são calculados juntos, sobre o mesmo candidato ou bloco de candidatos (modo vetorizado),
+        e o resultado é um único custo, utilizável por qualquer otimizador e avaliador.
+        f_custo: Função custo original
+        g: Função das restrições: retorna m valores por candidato, (m,) ou (n, m); uma restrição pode retornar escalar/(n,)
+        metodo: 'penalidade' -> custo + peso*soma(max(0, g)**2)
+                'viabilidade' -> regras de Deb: soluções viáveis mantêm o custo e as inviáveis valem
+                                 deslocamento + violação total, ficando sempre atrás das viáveis e ordenadas
+                                 pela violação. deslocamento deve ser maior que qualquer custo viável.
+        Deve ser serializável para avaliadores em processos (f_custo e g definidas no nível de um módulo).
+        '''
+        if metodo not in ('penalidade', 'viabilidade'):
+            raise ValueError("Método de restrições desconhecido: {}".format(metodo))
+
+        self.f_custo = f_custo
+        self.g = g
+        self.metodo = metodo
+        self.peso = peso
+        self.deslocamento = deslocamento
+
+
+    def partes_violadas(self, x, custo_ndim=None):
+        '''
+        Partes positivas de g(x), (..., m): zero nas restrições satisfeitas
+        '''
+        if custo_ndim is None: custo_ndim = np.ndim(x) - 1
+
+        G = np.asarray(self.g(x), dtype=float)
+        if G.ndim == custo_ndim:
+            G = G[..., np.newaxis]  # Uma única restrição
+
+        return np.maximum(G, 0)
+
+
+    def violacao(self, x):
+        '''
+        Violação total das restrições: soma das partes positivas de g(x)
+        '''
+        return np.sum(self.partes_violadas(x), axis=-1)
+
+
+    def __call__(self, x):
+        custo = np.asarray(self.f_custo(x), dtype=float)
+        partes = self.partes_violadas(x, custo.ndim)
+
+        if self.metodo == 'penalidade':
+            return custo + self.peso*np.sum(partes**2, axis=-1)
+
+        viol = np.sum(partes, axis=-1)
+        return np.where(viol > 0, self.deslocamento + viol, custo)
+
+
+    def viavel(self, x):
+        '''
+        Se cada candidato satisfaz todas as restrições
+        '''
+        return self.violacao(x) <= 0
@@ -0,0 +1,319 @@
+import numpy as np
+
+from .aleatorio import cria_rng, uniforme
+from .avaliador import cria_avaliador
+from .parada import CriterioParada
+from .limites import cria_estrategia
+from .ed import sorteia_distintos
+
+
+class Lote(object):
+
+    def __init__(self, n_exec, n_cand, dim, lim_inf, lim_sup, n_ger, f_custo, vectorized=False, avaliador=None, seed=None,
+                 custo_alvo=None, max_estagnacao=None, max_avaliacoes=None, tol=0.0, tempo_max=None, estrategia_limites='corte'):
+        '''
+        Base dos otimizadores em lote: n_exec execuções independentes do mesmo algoritmo avançam juntas,
+        com a população de todas guardada em um único array (n_exec, n_cand, dim) e operações vetorizadas
+        sobre as execuções. Cada execução tem seus próprios melhores, contadores e critérios de parada.
+        n_exec: Número de execuções independentes
+        n_cand, dim, lim_inf, lim_sup, n_ger, f_custo: Como nos otimizadores individuais
+        vectorized: Se True, a função custo recebe a matriz (m, dim) com os candidatos de todas as execuções
+        avaliador: Backend de avaliação: 'serial', 'threads', 'processos', 'compartilhado' ou um objeto do módulo avaliador
+        seed: Semente ou np.random.Generator do lote
+        custo_alvo, max_estagnacao, max_avaliacoes, tol, tempo_max: Critérios de parada de cada execução, verificados
+                 por um CriterioParada por execução (ver parada.CriterioParada). custo_alvo pode ser um vetor com um valor por execução
+        estrategia_limites: Estratégia de limites: nome ou objeto do módulo limites. O padrão de cada classe é o do otimizador individual
+        '''
+        self.n_exec = n_exec
+        self.n_cand = n_cand
+        self.dim = dim
+        self.lim_inf = np.broadcast_to(np.asarray(lim_inf, dtype=float), dim)   # Como em Otimizador
+        self.lim_sup = np.broadcast_to(np.asarray(lim_sup, dtype=float), dim)
+        self.n_ger = n_ger
+        self.f_custo = f_custo
+        self.vectorized = vectorized
+        self.avaliador = cria_avaliador(avaliador)
+        self.fecha_avaliador = isinstance(avaliador, str)
+        self.rng = cria_rng(seed)
+        self.limites = cria_estrategia(estrategia_limites)
+
+        custo_alvo = [None]*n_exec if custo_alvo is None else self.por_execucao(custo_alvo)
+        self.paradas = [CriterioParada(custo_alvo[i], max_estagnacao, tempo_max, max_avaliacoes, tol) for i in range(n_exec)]
+
+        # Estado de cada execução
+        self.ativas = np.ones(n_exec, dtype=bool)
+        self.geracao = 0                                # Gerações do lote
+        self.geracoes = np.zeros(n_exec, dtype=int)     # Gerações concluídas por execução
+        self.n_avaliacoes = np.zeros(n_exec, dtype=int)
+        self.motivo_parada = np.full(n_exec, None, dtype=object)
+
+        self.best = np.zeros((n_exec, dim))
+        self.best_custo = np.full(n_exec, np.inf)
+
+
+    def por_execucao(self, valor):
+        '''
+        Converte um parâmetro escalar ou com um valor por execução para o vetor (n_exec,)
+        '''
+        return np.broadcast_to(np.asarray(valor, dtype=float), (self.n_exec,)).copy()
+
+
+    def popula(self):
+        '''
+        Populações iniciais de todas as execuções, (n_exec, n_cand, dim), sorteadas como em Otimizador.popula
+        '''
+        return uniforme(self.rng, self.lim_inf, self.lim_sup, (self.n_exec, self.n_cand, self.dim))
+
+
+    def limita_cands(self, cands, origem=None):
+        '''
+        Aplica a estratégia de limites aos candidatos (n_exec, m, dim); "origem" são as soluções que os originaram
+        '''
+        return self.limites.aplica(cands, self.lim_inf, self.lim_sup, origem, self.rng)
+
+
+    def avalia(self, cands):
+        '''
+        Avalia os candidatos (n_exec, m, dim) apenas das execuções ativas, em uma única chamada ao avaliador.
+        Execuções encerradas recebem custo infinito, o que impede qualquer atualização do seu estado.
+        '''
+        custos = np.full(cands.shape[:2], np.inf)
+
+        ativos = cands[self.ativas]
+        if len(ativos):
+            custos[self.ativas] = self.avaliador.avalia(self.f_custo, ativos.reshape(-1, self.dim), self.vectorized).reshape(ativos.shape[:2])
+            self.n_avaliacoes[self.ativas] += cands.shape[1]
+
+        return custos
+
+
+    def atualiza_best(self, cands, custos):
+        '''
+        Atualiza o melhor candidato de cada execução a partir da matriz de custos (n_exec, n_cand)
+        '''
+        execs = np.arange(self.n_exec)
+        pos = np.argmin(custos, axis=1)
+        melhora = custos[execs, pos] < self.best_custo
+
+        self.best[melhora] = cands[execs[melhora], pos[melhora]]
+        self.best_custo[melhora] = custos[execs[melhora], pos[melhora]]
+
+
+    def verifica_parada(self):
+        '''
+        Verifica os critérios de parada de cada execução ativa e desativa as que atingiram algum
+        '''
+        for i in np.flatnonzero(self.ativas):
+            motivo = self.paradas[i].verifica(self.best_custo[i], self.n_avaliacoes[i])
+            if motivo:
+                self.motivo_parada[i] = motivo
+                self.ativas[i] = False
+
+
+    def inicializa(self):
+        raise NotImplementedError
+
+
+    def step(self):
+        raise NotImplementedError
+
+
+    def run(self):
+        '''
+        Executa todas as execuções até n_ger gerações ou até cada uma atingir seu critério de parada
+        '''
+        for parada in self.paradas:
+            parada.inicia()
+
+        self.inicializa()
+
+        while self.geracao < self.n_ger:
+
+            self.verifica_parada()
+            if not self.ativas.any(): break
+
+            self.step()
+
+            self.geracao += 1
+            self.geracoes[self.ativas] += 1
+
+        if self.fecha_avaliador: self.avaliador.fecha()
+
+        return self.get_best()
+
+
+    def get_best(self):
+        '''
+        Retorna as melhores soluções (n_exec, dim) e os respectivos custos (n_exec,)
+        '''
+        return self.best, self.best_custo
+
+
+    def resultados(self):
+        '''
+        Resultados de todas as execuções como arrays, indexados pela execução
+        '''
+        return {
+            'best': self.best,
+            'best_custo': self.best_custo,
+            'n_avaliacoes': self.n_avaliacoes,
+            'geracoes': self.geracoes,
+            'motivo_parada': self.motivo_parada,
+        }
+
+
+class PSOLote(Lote):
+
+    def __init__(self, n_exec, n_cand, dim, lim_inf, lim_sup, n_iter, f_custo, c1=2, c2=2, w_min=0.4, w_max=0.6, estrategia_limites='fator95', executar=True, **kwargs):
+        '''
+        n_exec execuções do PSO síncrono em lote. c1, c2, w_min e w_max podem ser escalares ou vetores com um
+        valor por execução (varredura de hiperparâmetros). Demais argumentos em Lote.
+        '''
+        Lote.__init__(self, n_exec, n_cand, dim, lim_inf, lim_sup, n_iter, f_custo, estrategia_limites=estrategia_limites, **kwargs)
+
+        # Hiperparâmetros no formato (n_exec, 1, 1) para o broadcast sobre (n_exec, n_cand, dim)
+        self.c1 = self.por_execucao(c1)[:, np.newaxis, np.newaxis]
+        self.c2 = self.por_execucao(c2)[:, np.newaxis, np.newaxis]
+        self.w_min = self.por_execucao(w_min)[:, np.newaxis, np.newaxis]
+        self.w_max = self.por_execucao(w_max)[:, np.newaxis, np.newaxis]
+
+        if executar: self.run()
+
+
+    def inicializa(self):
+
+        self.pop = self.popula()
+        self.v = np.zeros_like(self.pop)
+
+        self.p_best = self.pop.copy()
+        self.p_best_custo = self.avalia(self.pop)
+
+        self.atualiza_best(self.p_best, self.p_best_custo)
+
+
+    def step(self):
+
+        w = self.w_max - self.geracao*(self.w_max-self.w_min)/max(self.n_ger-1, 1)
+        r1 = self.rng.random(self.pop.shape)
+        r2 = self.rng.random(self.pop.shape)
+
+        self.v = w*self.v + self.c1*r1*(self.p_best - self.pop) + self.c2*r2*(self.best[:, np.newaxis] - self.pop)
+        self.pop = self.limita_cands(self.pop + self.v, self.pop)
+
+        custos = self.avalia(self.pop)
+
+        melhora = custos < self.p_best_custo
+        self.p_best[melhora] = self.pop[melhora]
+        self.p_best_custo[melhora] = custos[melhora]
+
+        self.atualiza_best(self.p_best, self.p_best_custo)
+
+
+class EDLote(Lote):
+
+    def __init__(self, n_exec, tam_pop, dim, n_ger, prob_mut, min_vals, max_vals, f_custo, F=None, estrategia_limites='corte95', executar=True, **kwargs):
+        '''
+        n_exec execuções da ED síncrona (DE/rand/1/bin) em lote. prob_mut e F podem ser escalares ou vetores com
+        um valor por execução; por padrão, F é sorteado para cada execução, como na classe ED. Demais argumentos em Lote.
+        '''
+        Lote.__init__(self, n_exec, tam_pop, dim, min_vals, max_vals, n_ger, f_custo, estrategia_limites=estrategia_limites, **kwargs)
+
+        self.prob_mut = self.por_execucao(prob_mut)[:, np.newaxis, np.newaxis]
+        self.F = self.por_execucao(self.rng.random(n_exec) if F is None else F)[:, np.newaxis, np.newaxis]
+
+        if executar: self.run()
+
+
+    def inicializa(self):
+
+        self.vet_cand = self.popula()
+        self.vet_cust = self.avalia(self.vet_cand)
+
+        self.atualiza_best(self.vet_cand, self.vet_cust)
+
+
+    def step(self):
+
+        # Índices sorteados dentro de cada execução: a mesma rotina da ED aplicada a todos os alvos do lote
+        alvos = np.tile(np.arange(self.n_cand), self.n_exec)
+        r = sorteia_distintos(self.rng, alvos, self.n_cand, 3).reshape(self.n_exec, self.n_cand, 3)
+        execs = np.arange(self.n_exec)[:, np.newaxis]
+
+        mutantes = self.vet_cand[execs, r[..., 0]] + self.F*(self.vet_cand[execs, r[..., 1]] - self.vet_cand[execs, r[..., 2]])
+
+        mascara = self.rng.random(self.vet_cand.shape) <= self.prob_mut
+        pos_aleat_caract = self.rng.integers(0, self.dim, (self.n_exec, self.n_cand))
+        mascara[execs, np.arange(self.n_cand), pos_aleat_caract] = True
+
+        experimentais = self.limita_cands(np.where(mascara, mutantes, self.vet_cand), self.vet_cand)
+        custos = self.avalia(experimentais)
+
+        melhora = custos < self.vet_cust
+        self.vet_cand[melhora] = experimentais[melhora]
+        self.vet_cust[melhora] = custos[melhora]
+
+        self.atualiza_best(self.vet_cand, self.vet_cust)
+
+
+class TLBOLote(Lote):
+
+    def __init__(self, n_exec, n_cand, n_iters, dim, lim_inf, lim_sup, f_custo, estrategia_limites='fator95', executar=True, **kwargs):
+        '''
+        n_exec execuções do TLBO síncrono em lote. Demais argumentos em Lote.
+        '''
+        Lote.__init__(self, n_exec, n_cand, dim, lim_inf, lim_sup, n_iters, f_custo, estrategia_limites=estrategia_limites, **kwargs)
+
+        if executar: self.run()
+
+
+    def inicializa(self):
+
+        self.vet_cand = self.popula()
+        self.vet_custos = self.avalia(self.vet_cand)
+
+        self.atualiza_best(self.vet_cand, self.vet_custos)
+
+
+    def sorteia_parceiros(self):
+        '''
+        Desarranjo independente para cada execução: linhas com ponto fixo são sorteadas novamente
+        '''
+        k = self.rng.permuted(np.tile(np.arange(self.n_cand), (self.n_exec, 1)), axis=1)
+
+        while True:
+            fixos = np.any(k == np.arange(self.n_cand), axis=1)
+            if not fixos.any():
+                return k
+            k[fixos] = self.rng.permuted(k[fixos], axis=1)
+
+
+    def aplica_melhoras(self, novos_alunos, novos_custos):
+
+        melhora = novos_custos < self.vet_custos
+        self.vet_cand[melhora] = novos_alunos[melhora]
+        self.vet_custos[melhora] = novos_custos[melhora]
+
+
+    def step(self):
+
+        forma = (self.n_exec, self.n_cand, 1)
+
+        # Fase professor
+        prof = self.best[:, np.newaxis]
+        media = np.mean(self.vet_cand, axis=1, keepdims=True)
+        TF = self.rng.integers(1, 3, forma)
+
+        novos_alunos = self.limita_cands(self.vet_cand + self.rng.random(forma)*(prof - TF*media), self.vet_cand)
+        self.aplica_melhoras(novos_alunos, self.avalia(novos_alunos))
+
+        # Fase aluno
+        k = self.sorteia_parceiros()
+        execs = np.arange(self.n_exec)[:, np.newaxis]
+
+        sinal = np.where(self.vet_custos <= self.vet_custos[execs, k], 1.0, -1.0)[..., np.newaxis]
+        passo = sinal*(self.vet_cand - self.vet_cand[execs, k])
+
+        novos_alunos = self.limita_cands(self.vet_cand + self.rng.random(forma)*passo, self.vet_cand)
+        self.aplica_melhoras(novos_alunos, self.avalia(novos_alunos))
+
+        self.atualiza_best(self.vet_cand, self.vet_custos)
@@ -0,0 +1,163 @@
+import sys
+import time
+import numpy as np
+
+
+def diversidade(pop):
+    '''
+    Diversidade da população: média, entre as dimensões, do desvio padrão das soluções candidatas
+    '''
+    return float(np.mean(np.std(pop, axis=0)))
+
+
+class ObservadorNulo(object):
+    '''
+    Observador padrão: não faz nada. Os otimizadores chamam inicio(), geracao() e fim() de seus
+    observadores; subclasses sobrescrevem apenas os eventos de interesse.
+    '''
+
+    def inicio(self, otim):
+        pass
+
+
+    def geracao(self, otim):
+        '''
+        Chamado ao fim de cada geração. O estado é lido do próprio otimizador: otim.geracao,
+        otim.get_best(), otim.get_pop(), otim.n_avaliacoes
+        '''
+        pass
+
+
+    def fim(self, otim):
+        pass
+
+
+class ObservadorLog(ObservadorNulo):
+
+    def __init__(self, intervalo=1, arquivo=None):
+        '''
+        Imprime o melhor custo a cada "intervalo" gerações, além do início e do fim da otimização.
+        arquivo: Objeto de arquivo de saída. Por padrão, sys.stdout
+        '''
+        self.intervalo = intervalo
+        self.arquivo = arquivo
+
+
+    def escreve(self, texto):
+        print(texto, file=self.arquivo or sys.stdout)
+
+
+    def inicio(self, otim):
+        self.escreve("=== Iniciando otimização ({}) ===\n".format(type(otim).__name__))
+
+
+    def geracao(self, otim):
+        if otim.geracao % self.intervalo == 0:
+            self.escreve("Geração {} - Melhor custo: {:.6g}".format(otim.geracao, otim.get_best()[1]))
+
+
+    def fim(self, otim):
+        self.escreve("\n=== Fim da otimização ({}) - Melhor custo: {:.6g} ===".format(otim.motivo_parada or 'n_geracoes', otim.get_best()[1]))
+
+
+class ObservadorHistorico(ObservadorNulo):
+
+    def __init__(self, registra_diversidade=False, capacidade=1024):
+        '''
+        Guarda em memória, a cada geração, o melhor custo, o número de avaliações, o tempo da geração e,
+        opcionalmente, a diversidade da população (que exige uma passada sobre a população inteira).
+        registra_diversidade pode ser True (desvio padrão médio) ou uma função da população, como as do módulo diversidade.
+        Os vetores são pré-alocados e crescem dobrando de tamanho; use historico() para obtê-los.
+        '''
+        self.registra_diversidade = bool(registra_diversidade)
+        self.medida = registra_diversidade if callable(registra_diversidade) else diversidade
+        self.capacidade = capacidade
+        self.n = 0
+
+        self.melhores = np.zeros(capacidade)
+        self.avaliacoes = np.zeros(capacidade, dtype=np.int64)
+        self.tempos = np.zeros(capacidade)
+        self.diversidades = np.zeros(capacidade) if registra_diversidade else None
+
+        self.t_anterior = None
+
+
+    def inicio(self, otim):
+        self.t_anterior = time.perf_counter()
+
+
+    def cresce(self):
+        self.capacidade *= 2
+        self.melhores = np.resize(self.melhores, self.capacidade)
+        self.avaliacoes = np.resize(self.avaliacoes, self.capacidade)
+        self.tempos = np.resize(self.tempos, self.capacidade)
+        if self.registra_diversidade:
+            self.diversidades = np.resize(self.diversidades, self.capacidade)
+
+
+    def geracao(self, otim):
+        agora = time.perf_counter()
+
+        if self.n == self.capacidade:
+            self.cresce()
+
+        self.melhores[self.n] = otim.get_best()[1]
+        self.avaliacoes[self.n] = otim.n_avaliacoes
+        self.tempos[self.n] = agora - self.t_anterior
+        if self.registra_diversidade:
+            self.diversidades[self.n] = self.medida(otim.get_pop())
+
+        self.n += 1
+        self.t_anterior = time.perf_counter() # Não conta o tempo gasto pelo próprio observador
+
+
+    def historico(self):
+        '''
+        Retorna um dicionário com os vetores registrados até agora
+        '''
+        hist = {
+            'melhor_custo': self.melhores[:self.n],
+            'avaliacoes': self.avaliacoes[:self.n],
+            'tempo': self.tempos[:self.n],
+        }
+        if self.registra_diversidade:
+            hist['diversidade'] = self.diversidades[:self.n]
+
+        return hist
+
+
+class ObservadorComposto(ObservadorNulo):
+
+    def __init__(self, observadores):
+        '''
+        Repassa os eventos a uma lista de observadores
+        '''
+        self.observadores = list(observadores)
+
+
+    def inicio(self, otim):
+        for obs in self.observadores:
+            obs.inicio(otim)
+
+
+    def geracao(self, otim):
+        for obs in self.observadores:
+            obs.geracao(otim)
+
+
+    def fim(self, otim):
+        for obs in self.observadores:
+            obs.fim(otim)
+
+
+def cria_observador(observador=None, verbose=False):
+    '''
+    Retorna o observador da otimização: o próprio objeto, um ObservadorComposto para uma lista de observadores,
+    ou, se nenhum for dado, um ObservadorLog quando verbose é True e um ObservadorNulo (silencioso) caso contrário.
+    '''
+    if observador is None:
+        return ObservadorLog() if verbose else ObservadorNulo()
+    if isinstance(observador, (list, tuple)):
+        return ObservadorComposto(observador)
+
+    return observador
@@ -0,0 +1,260 @@
+import numpy as np
+
+from .aleatorio import cria_rng, uniforme
+from .avaliador import cria_avaliador
+from .parada import CriterioParada
+from .observadores import cria_observador
+from .limites import cria_estrategia
+from .perfil import cria_perfil
+
+
+class Otimizador(object):
+
+    atributos_estado = ()   # Atributos salvos pelo checkpoint (ver checkpoint.py)
+    componentes_estado = ('surrogato',) # Objetos cujo estado (seus próprios atributos_estado) também é salvo
+    operadores_perfil = ('step', 'ask', 'recebe_custos', 'avalia_cands', 'avalia_triagem', 'limita_cands') # Métodos cronometrados pelo perfil (ver perfil.py)
+    atributos_pop = None    # Nomes dos atributos (população, custos, melhor solução, melhor custo) usados por get_pop, get_best, emigrantes, reinicia e recebe_imigrantes
+
+
+    def __init__(self, f_custo, dim, n_geracoes, lim_inf=None, lim_sup=None, vectorized=False, avaliador=None, sincrono=None, seed=None, parada=None, checkpoint=None, verbose=False, observador=None, estrategia_limites='corte', surrogato=None, perfil=None):
+        '''
+        Base comum dos otimizadores: configuração da avaliação, do gerador aleatório, dos critérios de parada,
+        do checkpoint e dos observadores, o estado da execução e os caminhos únicos de inicialização, avaliação,
+        limitação e execução (run). Os argumentos têm o mesmo significado em todos os algoritmos.
+        n_geracoes: Número total de gerações/iterações da otimização
+        lim_inf, lim_sup: Limites das variáveis (escalares ou vetores), guardados como vetores float (dim,)
+        perfil: Se True (ou um objeto Perfil), cronometra os operadores de operadores_perfil e as avaliações;
+                o resultado é obtido com relatorio_perfil()
+        '''
+        self.f_custo = f_custo
+        self.dim = dim
+        self.n_geracoes = n_geracoes
+
+        if lim_inf is not None:
+            self.lim_inf = np.broadcast_to(np.asarray(lim_inf, dtype=float), dim)
+            self.lim_sup = np.broadcast_to(np.asarray(lim_sup, dtype=float), dim)
+
+        self.vectorized = vectorized
+        self.avaliador = cria_avaliador(avaliador)
+        self.fecha_avaliador = isinstance(avaliador, str) # Pools criados aqui são encerrados no fim da otimização
+        self.sincrono = (vectorized or self.avaliador.paralelo) if sincrono is None else sincrono
+        self.rng = cria_rng(seed)
+        self.parada = parada or CriterioParada()
+        self.checkpoint = checkpoint
+        self.verbose = verbose
+        self.observador = cria_observador(observador, verbose)
+        self.limites = cria_estrategia(estrategia_limites)
+        self.surrogato = surrogato
+        self.perfil = cria_perfil(perfil)
+
+        # Estado da execução
+        self.iniciado = False       # Se a população inicial já foi avaliada
+        self.geracao = 0            # Gerações concluídas
+        self.n_avaliacoes = 0       # Avaliações da função custo
+        self.motivo_parada = None
+
+        if self.perfil is not None: self.perfil.instrumenta(self, self.operadores_perfil)
+
+
+    def tell(self, custos):
+        '''
+        Recebe os custos, calculados fora do otimizador, dos candidatos retornados por ask(). Os custos são
+        copiados (o otimizador altera seus vetores de custos) e contados em n_avaliacoes
+        '''
+        custos = np.array(custos, dtype=float)
+        self.n_avaliacoes += len(custos)
+
+        self.recebe_custos(custos)
+
+
+    def recebe_custos(self, custos):
+        '''
+        Aplica os custos dos candidatos retornados por ask(). Usado diretamente quando os custos vêm de
+        avalia_cands, que já os conta em n_avaliacoes
+        '''
+        raise NotImplementedError
+
+
+    def popula(self, n):
+        '''
+        Sorteia n soluções candidatas com distribuição uniforme entre os limites, matriz (n, dim)
+        '''
+        return uniforme(self.rng, self.lim_inf, self.lim_sup, (n, self.dim))
+
+
+    def funcao_custo(self):
+        '''
+        Função enviada ao avaliador
+        '''
+        return self.f_custo
+
+
+    def avalia_cands(self, cands):
+        '''
+        Avalia uma matriz de soluções candidatas e retorna o vetor de custos.
+        No modo vetorizado a função custo é chamada uma única vez com a matriz inteira (ou com cada bloco, em pools).
+        '''
+        self.n_avaliacoes += len(cands)
+        custos = self.avaliador.avalia(self.funcao_custo(), cands, self.vectorized)
+
+        if self.surrogato is not None: self.surrogato.atualiza(cands, custos)
+
+        return custos
+
+
+    def avalia_triagem(self, cands, custos_ref):
+        '''
+        Avalia os candidatos que substituiriam soluções de custos "custos_ref". Com um surrogato, apenas os
+        pré-selecionados pelo modelo são avaliados pela função custo; os demais recebem custo infinito
+        '''
+        if self.surrogato is None:
+            return self.avalia_cands(cands)
+
+        return self.surrogato.avalia(cands, custos_ref, self.avalia_cands)
+
+
+    def limita_cands(self, cands, origem=None):
+        '''
+        Aplica a estratégia de limites aos candidatos "cands"; "origem" são as soluções que os originaram
+        (usadas por estratégias como 'ponto_medio')
+        '''
+        return self.limites.aplica(cands, self.lim_inf, self.lim_sup, origem, self.rng)
+
+
+    def inicializa(self):
+        '''
+        Cria e avalia a população inicial
+        '''
+        self.recebe_custos(self.avalia_cands(self.ask()))
+
+
+    def run(self):
+        '''
+        Executa as gerações restantes até n_geracoes ou até um critério de parada ser atingido
+        '''
+        self.parada.inicia()
+        if self.perfil is not None: self.perfil.inicio()
+
+        if not self.iniciado:
+            self.inicializa()
+
+        self.motivo_parada = None
+        self.observador.inicio(self)
+
+        while self.geracao < self.n_geracoes:
+
+            self.motivo_parada = self.parada.verifica(self.get_best()[1], self.n_avaliacoes)
+            if self.motivo_parada: break
+
+            self.step()
+
+            self.observador.geracao(self)
+            if self.checkpoint: self.checkpoint.verifica(self)
+
+        self.finaliza()
+
+        return self.get_best()
+
+
+    def finaliza(self):
+        '''
+        Encerra o avaliador (se criado pelo otimizador) e o perfil e notifica os observadores do fim da execução
+        '''
+        if self.fecha_avaliador: self.avaliador.fecha()
+        if self.perfil is not None: self.perfil.fim(self)
+
+        self.observador.fim(self)
+
+
+    def relatorio_perfil(self):
+        '''
+        Retorna o relatório do perfil (tempo e chamadas por operador, avaliações; ver perfil.py),
+        ou None se o otimizador foi criado sem perfil
+        '''
+        if self.perfil is None: return None
+
+        return self.perfil.relatorio(self)
+
+
+    def populacao(self):
+        '''
+        Retorna a população e o vetor de custos (atributos nomeados em atributos_pop)
+        '''
+        return getattr(self, self.atributos_pop[0]), getattr(self, self.atributos_pop[1])
+
+
+    def atualiza_best(self):
+        '''
+        Atualiza a melhor solução e seu custo com o melhor indivíduo da população
+        '''
+        pop, custos = self.populacao()
+        best_pos = np.argmin(custos)
+
+        setattr(self, self.atributos_pop[2], pop[best_pos].copy())
+        setattr(self, self.atributos_pop[3], custos[best_pos])
+
+
+    def get_pop(self):
+        '''
+        Retorna a população atual
+        '''
+        return self.populacao()[0]
+
+
+    def get_best(self):
+        '''
+        Retorna a melhor solução e seu respectivo custo
+        '''
+        return getattr(self, self.atributos_pop[2]), getattr(self, self.atributos_pop[3])
+
+
+    def emigrantes(self, n):
+        '''
+        Retorna os n melhores indivíduos da população e seus custos
+        '''
+        pop, custos = self.populacao()
+        melhores = np.argsort(custos)[:n]
+
+        return pop[melhores], custos[melhores]
+
+
+    def substitui(self, pos, cands, custos):
+        '''
+        Substitui os indivíduos nas posições "pos" pelos candidatos "cands", já avaliados, e atualiza a melhor solução
+        '''
+        pop, custos_pop = self.populacao()
+        pop[pos] = cands
+        custos_pop[pos] = custos
+
+        self.atualiza_best()
+
+
+    def reinicia(self, fracao, n_elite=1):
+        '''
+        Substitui a fração "fracao" dos piores indivíduos por novos indivíduos aleatórios, preservando os n_elite melhores
+        '''
+        custos = self.populacao()[1]
+        n = min(int(round(fracao*len(custos))), len(custos) - n_elite)
+        if n <= 0: return
+
+        piores = np.argsort(custos)[len(custos)-n:]
+        novos = self.popula(n)
+
+        self.substitui(piores, novos, self.avalia_cands(novos))
+
+
+    def recebe_imigrantes(self, cands, custos):
+        '''
+        Substitui os piores indivíduos da população pelos imigrantes
+        '''
+        custos_pop = self.populacao()[1]
+        piores = np.argsort(custos_pop)[len(custos_pop)-len(cands):]
+
+        self.substitui(piores, cands, custos)
+
+
+    def inicia_otim(self):
+        '''
+        Mantido por compatibilidade: equivale a run()
+        '''
+        return self.run()
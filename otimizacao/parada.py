@@ -0,0 +1,53 @@
+import time
+import numpy as np
+
+
+class CriterioParada(object):
+
+    def __init__(self, custo_alvo=None, max_estagnacao=None, tempo_max=None, max_avaliacoes=None, tol=0.0):
+        '''
+        Critérios de parada antecipada, verificados uma vez por geração. Os critérios em None ficam desativados.
+        custo_alvo: Para quando o melhor custo for menor ou igual a este valor
+        max_estagnacao: Para após este número de gerações seguidas sem melhora do melhor custo
+        tempo_max: Tempo máximo de execução, em segundos, a partir do início de run()
+        max_avaliacoes: Número máximo de avaliações da função custo (pode ser ultrapassado em até uma geração)
+        tol: Melhora mínima do melhor custo para que a geração não conte como estagnada
+        '''
+        self.custo_alvo = custo_alvo
+        self.max_estagnacao = max_estagnacao
+        self.tempo_max = tempo_max
+        self.max_avaliacoes = max_avaliacoes
+        self.tol = tol
+
+        self.inicia()
+
+
+    def inicia(self):
+        '''
+        Reinicia o relógio e o contador de estagnação
+        '''
+        self.inicio = time.perf_counter()
+        self.melhor = np.inf
+        self.estagnacao = 0
+
+
+    def verifica(self, melhor_custo, n_avaliacoes):
+        '''
+        Atualiza o estado com o melhor custo atual e retorna o motivo da parada, ou None se a otimização deve continuar
+        '''
+        if melhor_custo < self.melhor - self.tol:
+            self.melhor = melhor_custo
+            self.estagnacao = 0
+        else:
+            self.estagnacao += 1
+
+        if self.custo_alvo is not None and melhor_custo <= self.custo_alvo:
+            return 'custo_alvo'
+        if self.max_estagnacao is not None and self.estagnacao >= self.max_estagnacao:
+            return 'estagnacao'
+        if self.tempo_max is not None and time.perf_counter() - self.inicio >= self.tempo_max:
+            return 'tempo_max'
+        if self.max_avaliacoes is not None and n_avaliacoes >= self.max_avaliacoes:
+            return 'max_avaliacoes'
+
+        return None
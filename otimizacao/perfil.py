@@ -0,0 +1,199 @@
+import functools
+import time
+
+# cProfile, pstats e tracemalloc são importados apenas quando pedidos, para não pesar na importação dos otimizadores
+
+
+class Perfil(object):
+
+    def __init__(self, cprofile=False, memoria=False):
+        '''
+        Instrumentação de desempenho de um otimizador: número de chamadas e tempo acumulado (perf_counter) de cada
+        operador e fase listados em operadores_perfil da classe do otimizador, além do tempo total e do número
+        de avaliações de cada execução. Os métodos são substituídos por versões cronometradas apenas na própria
+        instância, então otimizadores sem perfil não têm custo algum.
+        Os tempos são inclusivos: o tempo de uma fase inclui o dos operadores e das avaliações chamados por ela,
+        e 'avalia_cands' é o tempo da função custo (incluindo o avaliador).
+        cprofile: Se True, executa cProfile durante run(); as estatísticas ficam em estatisticas() e no relatório
+        memoria: Se True, mede com tracemalloc o pico de memória alocada durante run() e guarda um snapshot ao fim
+        '''
+        self.cprofile = None
+        if cprofile:
+            import cProfile
+            self.cprofile = cProfile.Profile()
+        self.memoria = memoria
+
+        self.tempos = {}            # Operador -> tempo acumulado, em segundos
+        self.chamadas = {}          # Operador -> número de chamadas
+        self.tempo_total = 0.0      # Soma da duração das execuções
+        self.n_execucoes = 0
+        self.t_inicio = None
+
+        self.pico_memoria = 0       # Maior pico de memória alocada acima do início de uma execução, em bytes
+        self.memoria_inicial = 0
+        self.iniciou_tracemalloc = False
+        self.snapshot = None
+
+
+    def instrumenta(self, otim, nomes):
+        '''
+        Substitui, na instância "otim", cada método listado em "nomes" por sua versão cronometrada
+        '''
+        for nome in nomes:
+            if nome in self.tempos or not hasattr(otim, nome): continue
+            setattr(otim, nome, self.cronometra(nome, getattr(otim, nome)))
+
+
+    def cronometra(self, nome, metodo):
+        '''
+        Retorna o método envolvido por um cronômetro que acumula seu tempo e suas chamadas sob "nome"
+        '''
+        tempos = self.tempos
+        chamadas = self.chamadas
+        relogio = time.perf_counter
+
+        tempos[nome] = 0.0
+        chamadas[nome] = 0
+
+        @functools.wraps(metodo)
+        def medido(*args, **kwargs):
+            t0 = relogio()
+            try:
+                return metodo(*args, **kwargs)
+            finally:
+                tempos[nome] += relogio() - t0
+                chamadas[nome] += 1
+
+        return medido
+
+
+    def acumula(self, nome, tempo):
+        '''
+        Soma uma medida feita fora dos métodos cronometrados (por exemplo, avaliações assíncronas) sob "nome"
+        '''
+        self.tempos[nome] = self.tempos.get(nome, 0.0) + tempo
+        self.chamadas[nome] = self.chamadas.get(nome, 0) + 1
+
+
+    def inicio(self):
+        '''
+        Chamado no início de run(): dispara o relógio e, se ativos, cProfile e tracemalloc
+        '''
+        if self.memoria:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.iniciou_tracemalloc = True
+            tracemalloc.reset_peak()
+            self.memoria_inicial = tracemalloc.get_traced_memory()[0]
+
+        if self.cprofile is not None: self.cprofile.enable()
+
+        self.t_inicio = time.perf_counter()
+
+
+    def fim(self, otim):
+        '''
+        Chamado no fim de run(): acumula o tempo da execução e encerra cProfile e tracemalloc
+        '''
+        if self.t_inicio is None: return
+
+        self.tempo_total += time.perf_counter() - self.t_inicio
+        self.n_execucoes += 1
+        self.t_inicio = None
+
+        if self.cprofile is not None: self.cprofile.disable()
+
+        if self.memoria:
+            import tracemalloc
+            self.pico_memoria = max(self.pico_memoria, tracemalloc.get_traced_memory()[1] - self.memoria_inicial)
+            self.snapshot = tracemalloc.take_snapshot()
+            if self.iniciou_tracemalloc:
+                tracemalloc.stop()
+                self.iniciou_tracemalloc = False
+
+
+    def estatisticas(self):
+        '''
+        Retorna as estatísticas do cProfile (pstats.Stats), ou None se o cProfile não estiver ativo
+        '''
+        if self.cprofile is None: return None
+
+        import io
+        import pstats
+        return pstats.Stats(self.cprofile, stream=io.StringIO())
+
+
+    def relatorio(self, otim):
+        '''
+        Retorna um dicionário com o tempo total, o número de avaliações e, para cada operador chamado ao menos
+        uma vez (em ordem decrescente de tempo), as chamadas, o tempo acumulado, o tempo médio por chamada e a
+        fração do tempo total
+        '''
+        operadores = {}
+
+        for nome in sorted(self.tempos, key=self.tempos.get, reverse=True):
+            n = self.chamadas[nome]
+            if n == 0: continue
+
+            operadores[nome] = {
+                'chamadas': n,
+                'tempo': self.tempos[nome],
+                'tempo_medio': self.tempos[nome]/n,
+                'fracao': self.tempos[nome]/self.tempo_total if self.tempo_total > 0 else 0.0,
+            }
+
+        rel = {
+            'algoritmo': type(otim).__name__,
+            'execucoes': self.n_execucoes,
+            'geracoes': otim.geracao,
+            'tempo_total': self.tempo_total,
+            'n_avaliacoes': otim.n_avaliacoes,
+            'avaliacoes_por_segundo': otim.n_avaliacoes/self.tempo_total if self.tempo_total > 0 else 0.0,
+            'operadores': operadores,
+        }
+
+        if self.memoria:
+            rel['pico_memoria'] = self.pico_memoria
+        if self.cprofile is not None:
+            rel['cprofile'] = self.estatisticas()
+
+        return rel
+
+
+    def resumo(self, otim, n_linhas=20):
+        '''
+        Retorna o relatório formatado como texto: uma linha por operador e, se ativo, as n_linhas funções
+        de maior tempo acumulado segundo o cProfile
+        '''
+        rel = self.relatorio(otim)
+
+        linhas = [
+            "=== Perfil ({}) - {} gerações, {} avaliações em {:.4g} s ===".format(rel['algoritmo'], rel['geracoes'], rel['n_avaliacoes'], rel['tempo_total']),
+            "{:<24} {:>10} {:>12} {:>12} {:>8}".format('operador', 'chamadas', 'tempo (s)', 'médio (s)', '%'),
+        ]
+        for nome, op in rel['operadores'].items():
+            linhas.append("{:<24} {:>10} {:>12.4g} {:>12.4g} {:>8.1f}".format(nome, op['chamadas'], op['tempo'], op['tempo_medio'], 100*op['fracao']))
+
+        if self.memoria:
+            linhas.append("Pico de memória: {:.1f} KiB".format(self.pico_memoria/1024))
+
+        if self.cprofile is not None:
+            stats = self.estatisticas()
+            stats.sort_stats('cumulative').print_stats(n_linhas)
+            linhas.append(stats.stream.getvalue())
+
+        return '\n'.join(linhas)
+
+
+def cria_perfil(perfil=None):
+    '''
+    Converte o argumento "perfil" dos otimizadores: None/False desativa, True cria um Perfil com
+    cronômetros apenas, e um objeto Perfil é usado diretamente
+    '''
+    if perfil is None or perfil is False:
+        return None
+    if perfil is True:
+        return Perfil()
+
+    return perfil
@@ -0,0 +1,272 @@
+import numpy as np
+
+from .otimizador import Otimizador
+from .kernels import atualiza_pso
+from .limites import Fator95
+
+
+class PSO(Otimizador):
+    
+    atributos_estado = ('pop', 'pop_custos', 'v', 'p_best', 'p_best_custo', 'g_best', 'g_best_custo', 'taxa_sucesso', 'n_sucessos', 'n_atualizadas', 'iniciado', 'geracao', 'n_avaliacoes')
+    operadores_perfil = Otimizador.operadores_perfil + ('atualiza_assincrono', 'atualiza_g_best', 'propoe_individuo', 'aceita_individuo')
+    atributos_pop = ('p_best', 'p_best_custo', 'g_best', 'g_best_custo') # Emigrantes e reinícios usam os personal bests
+
+    def __init__(self, n_cand, dim, lim_inf, lim_sup, n_iter, f_custo, c1=2, c2=2, w_min=0.4, w_max=0.6, vectorized=False, sincrono=None, avaliador=None, seed=None, parada=None, checkpoint=None, verbose=False, observador=None, estrategia_limites='fator95', surrogato=None, modo_inercia='linear', perfil=None, executar=True):
+        
+        '''
+        PSO -> Particle Swarm Optimization (Otimização por nuvem de partículas)
+        n_cand: Número de soluções candidatas
+        dim: Dimensão do problema de otimização
+        lim_inf: Limite inferior dos valores do problema de otimização [colocar como numpy array]
+        lim_sup: Limite superior dos valores do problems de otimização [colocar como numpy array]
+        n_iter: Número de iterações
+        f_custo: Função custo
+        c1 e c2: Parâmetros cognitivo e social (o quanto vão em direção do melhor custo pessoal e o melhor custo global)
+        w_min e w_max: Parâmetros que definem a inercia da partícula, decaindo do valor máximo ao mínimo.
+        vectorized: Se True, a função custo recebe a matriz de partículas (n, dim) e retorna o vetor de custos (n,).
+        sincrono: Modo de atualização da nuvem. True move e avalia todas as partículas de uma vez, com operações
+                  sobre a matriz inteira; False atualiza partícula a partícula (assíncrono). Por padrão é síncrono
+                  no modo vetorizado ou com avaliador paralelo.
+        avaliador: Backend de avaliação: 'serial', 'threads', 'processos', 'compartilhado' ou um objeto do módulo avaliador
+        seed: Semente (int ou SeedSequence) ou np.random.Generator usado em todos os sorteios desta instância
+        parada: Objeto CriterioParada com critérios de parada antecipada (custo alvo, estagnação, tempo, avaliações)
+        checkpoint: Objeto Checkpoint para salvar o estado periodicamente (ver checkpoint.py)
+        verbose: Se True e nenhum observador for dado, imprime o melhor custo a cada iteração
+        observador: Observador (ou lista de observadores) chamado a cada iteração (ver observadores.py). Por padrão, silencioso
+        estrategia_limites: Estratégia de limites: 'corte', 'corte95', 'fator95', 'reflexao', 'reamostragem', 'ponto_medio' ou um objeto do módulo limites. Por padrão, 'fator95'
+        surrogato: Objeto PreSelecao (ver surrogato.py): só os candidatos mais promissores segundo um modelo substituto são avaliados pela função custo
+                   (partículas não avaliadas se movem, mas não atualizam o personal best)
+        modo_inercia: Controle da inércia e dos coeficientes:
+                      'linear' -> inércia decaindo linearmente de w_max a w_min ao longo das iterações
+                      'adaptativa' -> inércia w_min + (w_max - w_min)*taxa de sucesso, sendo a taxa de sucesso a fração
+                                      das partículas que melhoraram o personal best na última iteração (por exemplo,
+                                      com w_min=0 e w_max=1)
+                      'constricao' -> fator de constrição de Clerc e Kennedy sobre velocidade e coeficientes, sem
+                                      inércia; exige c1 + c2 > 4 (tipicamente c1 = c2 = 2.05)
+        perfil: Se True (ou um objeto Perfil, ver perfil.py), acumula o tempo e as chamadas de cada operador; veja relatorio_perfil()
+        executar: Se True, a otimização é executada já na construção. Caso contrário, use run(), step() ou ask()/tell()
+        '''
+        
+        Otimizador.__init__(self, f_custo, dim, n_iter, lim_inf, lim_sup, vectorized, avaliador, sincrono, seed, parada, checkpoint, verbose, observador, estrategia_limites, surrogato, perfil)
+
+        self.n_cand = n_cand
+        self.c1 = c1
+        self.c2 = c2
+        self.w_min = w_min
+        self.w_max = w_max
+
+        if modo_inercia not in ('linear', 'adaptativa', 'constricao'):
+            raise ValueError("Modo de inércia desconhecido: {}".format(modo_inercia))
+        if modo_inercia == 'constricao' and c1 + c2 <= 4:
+            raise ValueError("A constrição exige c1 + c2 > 4")
+        self.modo_inercia = modo_inercia
+        
+        # Estado da execução
+        self.taxa_sucesso = 1.0     # Fração das partículas que melhoraram o personal best na última iteração
+        self.n_sucessos = 0         # Melhoras e partículas atualizadas na iteração em andamento (partícula a partícula)
+        self.n_atualizadas = 0
+        
+        # Criando população
+        self.pop = np.zeros((n_cand, dim))
+        self.pop_custos = np.zeros(n_cand)
+        
+        # Criando variáveis p_best e g_best
+        self.p_best = None
+        self.p_best_custo = None
+        self.g_best = None
+        self.g_best_custo = None
+        
+        # Matriz de velocidades
+        self.v = np.zeros((n_cand, dim))
+        
+        # Dando início à otimização
+        if executar: self.run()
+
+
+    def inercia(self):
+        '''
+        Ponderação da inércia da iteração atual, decaindo linearmente de w_max a w_min
+        '''
+        return self.w_max - self.geracao*(self.w_max-self.w_min)/max(self.n_geracoes-1, 1)
+
+
+    def coeficientes(self):
+        '''
+        Inércia e coeficientes cognitivo e social (w, c1, c2) da iteração atual, segundo modo_inercia
+        '''
+        if self.modo_inercia == 'adaptativa':
+            return self.w_min + (self.w_max - self.w_min)*self.taxa_sucesso, self.c1, self.c2
+
+        if self.modo_inercia == 'constricao':
+            phi = self.c1 + self.c2
+            chi = 2/abs(2 - phi - np.sqrt(phi**2 - 4*phi))
+            return chi, chi*self.c1, chi*self.c2
+
+        return self.inercia(), self.c1, self.c2
+
+
+    def ask(self):
+        '''
+        Retorna a matriz de posições a serem avaliadas: a população inicial na primeira chamada e,
+        depois, as novas posições de todas as partículas (atualização síncrona). Os custos devem ser
+        informados em tell() na mesma ordem.
+        '''
+        if not self.iniciado:
+            self.pop = self.popula(self.n_cand)
+            return self.pop
+
+        r1 = self.rng.random((self.n_cand, self.dim))
+        r2 = self.rng.random((self.n_cand, self.dim))
+        w, c1, c2 = self.coeficientes()
+
+        # Velocidades e posições atualizadas in-place, em um único passo (ver kernels.py). O kernel já aplica
+        # a estratégia 'fator95'; as demais são aplicadas em seguida sobre as posições sem limitação
+        if isinstance(self.limites, Fator95):
+            atualiza_pso(self.pop, self.v, self.p_best, self.g_best, r1, r2, w, c1, c2, self.lim_inf, self.lim_sup)
+        else:
+            origem = self.pop.copy() if self.limites.usa_pais else None
+            atualiza_pso(self.pop, self.v, self.p_best, self.g_best, r1, r2, w, c1, c2, -np.inf, np.inf)
+            self.pop = self.limita_cands(self.pop, origem)
+
+        return self.pop
+
+
+    def recebe_custos(self, custos):
+        '''
+        Recebe os custos das posições retornadas por ask() e atualiza personal best e global best
+        '''
+        self.pop_custos = np.asarray(custos, dtype=float)
+
+        if not self.iniciado:
+            # Definindo g_best e p_best da população inicial
+            self.p_best = self.pop.copy()
+            self.p_best_custo = self.pop_custos.copy()
+            self.g_best_custo = np.inf
+            self.iniciado = True
+        else:
+            melhora = self.pop_custos < self.p_best_custo
+            self.taxa_sucesso = np.mean(melhora)
+            self.p_best[melhora] = self.pop[melhora]
+            self.p_best_custo[melhora] = self.pop_custos[melhora]
+            self.geracao += 1
+
+        self.atualiza_g_best()
+
+
+    def step(self):
+        '''
+        Executa uma iteração da nuvem (inicializando a população se necessário)
+        '''
+        if not self.iniciado:
+            self.inicializa()
+
+        if self.sincrono:
+            self.recebe_custos(self.avalia_triagem(self.ask(), self.p_best_custo))
+        else:
+            self.atualiza_assincrono(*self.coeficientes())
+            self.geracao += 1
+
+
+    def atualiza_g_best(self):
+        '''
+        Atualiza o global best com o melhor personal best, se este for melhor
+        '''
+        best_pos = np.argmin(self.p_best_custo)
+        if self.p_best_custo[best_pos] < self.g_best_custo:
+            self.g_best_custo = self.p_best_custo[best_pos]
+            self.g_best = self.p_best[best_pos].copy()
+
+
+    def atualiza_best(self):
+        '''
+        Equivale a atualiza_g_best: o global best só é substituído por um personal best melhor
+        '''
+        self.atualiza_g_best()
+
+
+    def get_pop(self):
+        '''
+        Retorna as posições atuais das partículas
+        '''
+        return self.pop
+
+
+    def substitui(self, pos, cands, custos):
+        '''
+        Reposiciona as partículas "pos" nos candidatos "cands", já avaliados, que passam a ser também seus
+        personal bests, com velocidade zerada
+        '''
+        self.pop[pos] = cands
+        self.pop_custos[pos] = custos
+        self.v[pos] = 0
+
+        Otimizador.substitui(self, pos, cands, custos)
+
+
+    def atualiza_assincrono(self, w, c1, c2):
+        '''
+        Atualiza as partículas uma a uma: cada partícula já se move em direção ao g_best atualizado pelas anteriores
+        '''
+        # Fatores aleatórios de todas as partículas sorteados de uma vez
+        R1 = self.rng.random((self.n_cand, self.dim))
+        R2 = self.rng.random((self.n_cand, self.dim))
+
+        for i in range(self.n_cand):
+
+            novo_cand = self.move_particula(i, w, c1, c2, R1[i], R2[i])
+            novo_custo = self.avalia_triagem(novo_cand[np.newaxis], self.p_best_custo[i:i+1])[0] # Obtendo custo do novo candidado
+
+            self.aceita_individuo(i, novo_cand, novo_custo)
+
+
+    def move_particula(self, i, w, c1, c2, r1, r2):
+        '''
+        Atualiza a velocidade da partícula i em direção ao seu personal best e ao g_best atual e retorna sua nova posição
+        '''
+        cand = self.pop[i]                  # Candidato atual
+        p_best_i = self.p_best[i]           # Personal best atual
+
+        v_i = self.v[i] # Velocidade atual do candidato
+
+        # Cálculo de nova velocidade:
+        v_i = w*v_i + c1*r1*(p_best_i - cand) + c2*r2*(self.g_best - cand)
+
+        self.v[i] = v_i # Atualizando nova velocidade
+
+        novo_cand = cand + v_i # Atualizando nova posição do candidato
+
+        return self.limita_cands(novo_cand, cand)  # Aplicando limitação
+
+
+    def propoe_individuo(self, i):
+        '''
+        Nova posição da partícula i, com fatores aleatórios sorteados na hora e os coeficientes da iteração atual
+        '''
+        return self.move_particula(i, *self.coeficientes(), self.rng.random(self.dim), self.rng.random(self.dim))
+
+
+    def aceita_individuo(self, i, novo_cand, novo_custo):
+        '''
+        Move a partícula i para a posição avaliada "novo_cand", atualizando personal best e global best
+        '''
+        # Atualizando o novo candidato na população
+        self.pop[i] = novo_cand
+        self.pop_custos[i] = novo_custo
+
+        # Taxa de sucesso recalculada a cada n_cand partículas atualizadas
+        self.n_sucessos += novo_custo < self.p_best_custo[i]
+        self.n_atualizadas += 1
+        if self.n_atualizadas == self.n_cand:
+            self.taxa_sucesso = self.n_sucessos/self.n_cand
+            self.n_sucessos = self.n_atualizadas = 0
+
+        # Comparando custo do novo candidato para personal best e global best
+        if novo_custo < self.p_best_custo[i]:
+
+            self.p_best[i] = novo_cand
+            self.p_best_custo[i] = novo_custo
+
+            if novo_custo < self.g_best_custo:
+
+                self.g_best_custo = novo_custo
+                self.g_best = novo_cand
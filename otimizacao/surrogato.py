@@ -0,0 +1,221 @@
+import numpy as np
+
+
+def distancias2(X, Y):
+    '''
+    Matriz (len(X), len(Y)) dos quadrados das distâncias euclidianas entre as linhas de X e de Y
+    '''
+    d2 = np.sum(X**2, axis=1)[:, np.newaxis] + np.sum(Y**2, axis=1) - 2*X @ Y.T
+    return np.maximum(d2, 0)
+
+
+class KNN(object):
+
+    def __init__(self, k=5):
+        '''
+        Regressor dos k vizinhos mais próximos, com média ponderada pelo inverso da distância
+        '''
+        self.k = k
+        self.X = None
+        self.y = None
+
+
+    def ajusta(self, X, y):
+        self.X = X
+        self.y = y
+
+
+    def prediz(self, X):
+        k = min(self.k, len(self.X))
+        d2 = distancias2(X, self.X)
+
+        vizinhos = np.argpartition(d2, k-1, axis=1)[:, :k]
+        d = np.sqrt(np.take_along_axis(d2, vizinhos, axis=1))
+
+        pesos = 1/(d + 1e-12)
+        return np.sum(pesos*self.y[vizinhos], axis=1)/np.sum(pesos, axis=1)
+
+
+class RBF(object):
+
+    def __init__(self, regularizacao=1e-8):
+        '''
+        Interpolação por funções de base radial cúbicas (phi(r) = r³) com termo polinomial linear.
+        regularizacao: Termo somado à diagonal do sistema, para pontos muito próximos entre si
+        '''
+        self.regularizacao = regularizacao
+        self.X = None
+        self.pesos = None
+        self.coefs = None
+
+
+    def ajusta(self, X, y):
+        n, dim = X.shape
+
+        Phi = distancias2(X, X)**1.5
+        P = np.hstack([np.ones((n, 1)), X])
+
+        A = np.zeros((n + dim + 1, n + dim + 1))
+        A[:n, :n] = Phi + self.regularizacao*np.eye(n)
+        A[:n, n:] = P
+        A[n:, :n] = P.T
+
+        b = np.concatenate([y, np.zeros(dim + 1)])
+        try:
+            sol = np.linalg.solve(A, b)
+        except np.linalg.LinAlgError:
+            sol = np.linalg.lstsq(A, b, rcond=None)[0]
+
+        self.X = X
+        self.pesos = sol[:n]
+        self.coefs = sol[n:]
+
+
+    def prediz(self, X):
+        return distancias2(X, self.X)**1.5 @ self.pesos + self.coefs[0] + X @ self.coefs[1:]
+
+
+MODELOS = {
+    'knn': KNN,
+    'rbf': RBF,
+}
+
+
+class Arquivo(object):
+
+    atributos_estado = ('cands', 'custos', 'n', 'proxima', 'versao')
+
+
+    def __init__(self, capacidade=500):
+        '''
+        Arquivo circular das últimas "capacidade" soluções avaliadas pela função custo real e seus custos
+        '''
+        self.capacidade = capacidade
+        self.cands = None
+        self.custos = np.zeros(capacidade)
+        self.n = 0          # Número de soluções armazenadas
+        self.proxima = 0    # Posição da próxima inserção
+        self.versao = 0     # Incrementada a cada inserção, para o modelo saber quando reajustar
+
+
+    def adiciona(self, cands, custos):
+        '''
+        Insere as soluções com custo finito, sobrescrevendo as mais antigas quando o arquivo está cheio
+        '''
+        finitos = np.isfinite(custos)
+        cands, custos = cands[finitos][-self.capacidade:], custos[finitos][-self.capacidade:]
+        if not len(custos): return
+
+        if self.cands is None:
+            self.cands = np.zeros((self.capacidade, cands.shape[1]))
+
+        pos = (self.proxima + np.arange(len(custos))) % self.capacidade
+        self.cands[pos] = cands
+        self.custos[pos] = custos
+
+        self.proxima = (self.proxima + len(custos)) % self.capacidade
+        self.n = min(self.n + len(custos), self.capacidade)
+        self.versao += 1
+
+
+    def dados(self):
+        '''
+        Soluções e custos armazenados
+        '''
+        return self.cands[:self.n], self.custos[:self.n]
+
+
+class PreSelecao(object):
+
+    # Salvos pelo checkpoint do otimizador (ver checkpoint.py); o modelo é reajustado sobre o arquivo restaurado
+    atributos_estado = ('rejeicoes', 'n_previstos', 'n_avaliados')
+    componentes_estado = ('arquivo',)
+
+
+    def __init__(self, modelo='rbf', fracao=0.25, n_min=None, capacidade=500):
+        '''
+        Pré-seleção assistida por modelo substituto, para funções custo caras. Um regressor ajustado sobre o
+        arquivo de soluções já avaliadas prevê o custo dos novos candidatos, e só os mais promissores são
+        avaliados pela função custo real; os demais recebem custo infinito, isto é, são rejeitados pela
+        seleção gulosa do otimizador. Toda avaliação real do otimizador alimenta o arquivo.
+        modelo: 'rbf', 'knn' ou um objeto com os métodos ajusta(X, y) e prediz(X)
+        fracao: Fração de cada lote de candidatos avaliada pela função custo real: os de maior melhora prevista
+                em relação à solução que substituiriam. Candidatos avaliados um a um (modos assíncronos) são
+                avaliados quando a previsão indica melhora ou após 1/fracao - 1 rejeições seguidas.
+        n_min: Tamanho mínimo do arquivo para usar o modelo; antes disso, todos os candidatos são avaliados.
+               Por padrão, 2*(dim+1)
+        capacidade: Número de soluções mantidas no arquivo (as mais recentes)
+        '''
+        self.modelo = MODELOS[modelo]() if isinstance(modelo, str) else modelo
+        self.fracao = fracao
+        self.n_min = n_min
+        self.arquivo = Arquivo(capacidade)
+
+        self.versao_modelo = -1     # Versão do arquivo usada no último ajuste
+        self.rejeicoes = 0          # Rejeições seguidas de candidatos avaliados um a um
+        self.n_previstos = 0        # Candidatos avaliados apenas pelo modelo
+        self.n_avaliados = 0        # Candidatos pré-selecionados e avaliados pela função custo real
+
+
+    def atualiza(self, cands, custos):
+        '''
+        Adiciona ao arquivo soluções avaliadas pela função custo real
+        '''
+        self.arquivo.adiciona(np.asarray(cands, dtype=float), np.asarray(custos, dtype=float))
+
+
+    def ativo(self, dim):
+        '''
+        Se o arquivo já tem soluções suficientes para o uso do modelo
+        '''
+        n_min = self.n_min if self.n_min is not None else 2*(dim + 1)
+        return self.arquivo.n >= max(n_min, 2)
+
+
+    def prediz(self, cands):
+        '''
+        Custos previstos pelo modelo, reajustado apenas quando o arquivo mudou
+        '''
+        if self.versao_modelo != self.arquivo.versao:
+            self.modelo.ajusta(*self.arquivo.dados())
+            self.versao_modelo = self.arquivo.versao
+
+        return self.modelo.prediz(cands)
+
+
+    def seleciona(self, cands, custos_ref):
+        '''
+        Máscara dos candidatos que devem ser avaliados pela função custo real. custos_ref são os custos
+        das soluções que cada candidato substituiria.
+        '''
+        n = len(cands)
+        if not self.ativo(cands.shape[1]):
+            return np.ones(n, dtype=bool)
+
+        melhora = self.prediz(cands) - custos_ref
+
+        if n == 1:
+            avalia = melhora[0] < 0 or self.rejeicoes + 1 >= 1/self.fracao
+            self.rejeicoes = 0 if avalia else self.rejeicoes + 1
+            return np.array([avalia])
+
+        selecionados = np.zeros(n, dtype=bool)
+        selecionados[np.argsort(melhora)[:int(np.ceil(self.fracao*n))]] = True
+        return selecionados
+
+
+    def avalia(self, cands, custos_ref, avalia_cands):
+        '''
+        Avalia com "avalia_cands" (método do otimizador) apenas os candidatos pré-selecionados e retorna o
+        vetor de custos, infinito para os candidatos descartados
+        '''
+        selecionados = self.seleciona(cands, custos_ref)
+        custos = np.full(len(cands), np.inf)
+
+        if selecionados.any():
+            custos[selecionados] = avalia_cands(cands[selecionados])
+
+        self.n_avaliados += np.count_nonzero(selecionados)
+        self.n_previstos += len(cands) - np.count_nonzero(selecionados)
+
+        return custos
@@ -0,0 +1,257 @@
+import numpy as np
+
+from .otimizador import Otimizador
+
+
+class TLBO(Otimizador):
+
+    atributos_estado = ('vet_cand', 'vet_custos', 'vet_best_iter', 'best_cand', 'best_custo', 'fase', 'iniciado', 'geracao', 'n_avaliacoes')
+    operadores_perfil = Otimizador.operadores_perfil + ('fase_professor', 'fase_aluno', 'alunos_professor', 'alunos_aluno', 'aplica_melhoras')
+    atributos_pop = ('vet_cand', 'vet_custos', 'best_cand', 'best_custo')
+
+
+    def __init__(self, n_cand, n_iters, dim, lim_inf, lim_sup, f_custo, verbose, vectorized=False, avaliador=None, sincrono=None, seed=None, parada=None, checkpoint=None, observador=None, estrategia_limites='fator95', surrogato=None, perfil=None, executar=True):
+
+        '''
+        n_cand: Número de soluções candidatas
+        n_iters: Número de iterações
+        lim_inf: Limite inferior das soluções
+        lim_sup: Limite superior das soluções
+        dim: Dimensão do problema de otimização
+        f_custo: Função custo da otimização
+        verbose: Se a otimização deve apresentar resultados em tempo real [True/False]. Ignorado se um observador for dado
+        vectorized: Se True, a função custo recebe a matriz de candidatos (n, dim) e retorna o vetor de custos (n,).
+        avaliador: Backend de avaliação: 'serial', 'threads', 'processos', 'compartilhado' ou um objeto do módulo avaliador
+        sincrono: Se True, cada fase cria todos os novos alunos a partir da classe atual e os avalia de uma vez.
+                  Por padrão é síncrono no modo vetorizado ou com avaliador paralelo.
+        seed: Semente (int ou SeedSequence) ou np.random.Generator usado em todos os sorteios desta instância
+        parada: Objeto CriterioParada com critérios de parada antecipada (custo alvo, estagnação, tempo, avaliações)
+        checkpoint: Objeto Checkpoint para salvar o estado periodicamente (ver checkpoint.py)
+        observador: Observador (ou lista de observadores) chamado a cada iteração (ver observadores.py)
+        estrategia_limites: Estratégia de limites: 'corte', 'corte95', 'fator95', 'reflexao', 'reamostragem', 'ponto_medio' ou um objeto do módulo limites. Por padrão, 'fator95'
+        surrogato: Objeto PreSelecao (ver surrogato.py): só os candidatos mais promissores segundo um modelo substituto são avaliados pela função custo
+        perfil: Se True (ou um objeto Perfil, ver perfil.py), acumula o tempo e as chamadas de cada operador; veja relatorio_perfil()
+        executar: Se True, a otimização é executada já na construção. Caso contrário, use run(), step() ou ask()/tell()
+        '''
+
+        Otimizador.__init__(self, f_custo, dim, n_iters, lim_inf, lim_sup, vectorized, avaliador, sincrono, seed, parada, checkpoint, verbose, observador, estrategia_limites, surrogato, perfil)
+
+        self.n_cand = n_cand
+
+        # Estado da execução
+        self.fase = 'professor'     # Próxima fase a ser entregue por ask()
+        self.novos_alunos = None    # Novos alunos aguardando custos em tell()
+
+        self.vet_cand = None
+        self.vet_custos = np.zeros(self.n_cand)
+
+        self.vet_best_iter = np.zeros(self.n_geracoes)
+        self.best_cand = None
+        self.best_custo = None
+
+        if executar: self.run()
+
+
+    def inicio_iteracao(self):
+        '''
+        Define o professor (solução candidata de menor custo) e a média da classe, salvando o menor custo da iteração
+        '''
+        prof_pos = np.argmin(self.vet_custos)
+        prof = self.vet_cand[prof_pos]
+        prof_custo = self.vet_custos[prof_pos]
+
+        # Obtendo a média de todas as soluções candidatas
+        media = np.mean(self.vet_cand, axis=0)
+
+        # Salvando o melhor custo da iteração
+        if self.geracao < len(self.vet_best_iter):
+            self.vet_best_iter[self.geracao] = prof_custo
+        else:
+            self.vet_best_iter = np.append(self.vet_best_iter, prof_custo)
+
+        return prof, media
+
+
+    def ask(self):
+        '''
+        Retorna a matriz de candidatos a serem avaliados: a classe inicial na primeira chamada e, depois,
+        alternadamente os novos alunos da fase professor e da fase aluno (fases síncronas). Os custos
+        devem ser informados em tell() na mesma ordem.
+        '''
+        if not self.iniciado:
+            self.vet_cand = self.popula(self.n_cand)
+            return self.vet_cand
+
+        if self.fase == 'professor':
+            prof, media = self.inicio_iteracao()
+            self.novos_alunos = self.alunos_professor(prof, media)
+        else:
+            self.novos_alunos = self.alunos_aluno()
+
+        return self.novos_alunos
+
+
+    def recebe_custos(self, custos):
+        '''
+        Recebe os custos dos candidatos retornados por ask() e substitui os alunos que melhoraram
+        '''
+        custos = np.asarray(custos, dtype=float)
+
+        if not self.iniciado:
+            self.vet_custos = custos
+            self.iniciado = True
+        else:
+            self.aplica_melhoras(self.novos_alunos, custos)
+            self.novos_alunos = None
+
+            if self.fase == 'professor':
+                self.fase = 'aluno'
+            else:
+                self.fase = 'professor'
+                self.geracao += 1
+
+        self.atualiza_best()
+
+
+    def step(self):
+        '''
+        Executa uma iteração completa, fase professor e fase aluno (inicializando a classe se necessário)
+        '''
+        if not self.iniciado:
+            self.inicializa()
+
+        if self.fase == 'professor':
+            self.fase_professor()
+
+        self.fase_aluno()
+
+
+    def fase_professor(self):
+        '''
+        Fase professor: cada aluno se move na direção do professor, afastando-se da média da classe
+        '''
+        if self.sincrono:
+            self.recebe_custos(self.avalia_triagem(self.ask(), self.vet_custos))
+        else:
+            self.professor_assincrono(*self.inicio_iteracao())
+
+
+    def fase_aluno(self):
+        '''
+        Fase aluno: cada aluno interage com um parceiro sorteado. Conclui a iteração
+        '''
+        if self.sincrono:
+            self.recebe_custos(self.avalia_triagem(self.ask(), self.vet_custos))
+        else:
+            self.aluno_assincrono()
+            self.geracao += 1
+            self.atualiza_best()
+
+
+    def professor_assincrono(self, prof, media):
+        '''
+        Fase professor atualizando os alunos um a um: cada aluno substituído já é usado pelos seguintes
+        '''
+        vet_TF = self.rng.integers(1, 3, self.n_cand)
+        vet_r = self.rng.random(self.n_cand)
+
+        for i in range(self.n_cand):
+
+            # Aluno da iteração
+            aluno = self.vet_cand[i]
+            custo = self.vet_custos[i]
+
+            TF = vet_TF[i]
+
+            # Definindo novo aluno
+            novo_aluno = aluno + vet_r[i]*(prof-TF*media)
+            novo_aluno = self.limita_cands(novo_aluno, aluno)
+            novo_custo = self.avalia_triagem(novo_aluno[np.newaxis], self.vet_custos[i:i+1])[0]
+
+            
+            if novo_custo < custo:
+                self.vet_cand[i] = novo_aluno
+                self.vet_custos[i] = novo_custo
+
+
+    def aluno_assincrono(self):
+        '''
+        Fase aluno atualizando os alunos um a um
+        '''
+        # Deslocamento entre 1 e n_cand-1 garante que o aluno aleatório seja diferente do aluno da iteração
+        vet_k = (np.arange(self.n_cand) + self.rng.integers(1, self.n_cand, self.n_cand)) % self.n_cand
+        vet_r = self.rng.random(self.n_cand)
+
+        for j in range(self.n_cand):
+
+            # Aluno da iteração
+            aluno = self.vet_cand[j]
+            custo = self.vet_custos[j]
+
+            # Aluno aleatório, diferente do aluno da iteração atual
+            k = vet_k[j]
+
+            aluno_aleat = self.vet_cand[k]
+            custo_aleat = self.vet_custos[k]
+            
+            # Definindo o passo na direção do que possui menor custo
+            if custo <= custo_aleat:
+                passo = aluno - aluno_aleat
+            else:
+                passo = aluno_aleat - aluno
+            
+            # Definindo novo aluno
+            novo_aluno = aluno + vet_r[j]*passo
+            novo_aluno = self.limita_cands(novo_aluno, aluno)
+            novo_custo = self.avalia_triagem(novo_aluno[np.newaxis], self.vet_custos[j:j+1])[0]
+
+            if novo_custo < custo:
+                self.vet_cand[j] = novo_aluno
+                self.vet_custos[j] = novo_custo
+
+
+    def alunos_professor(self, prof, media):
+        '''
+        Novos alunos da fase professor para a classe inteira, com TF e fator aleatório sorteados por aluno
+        '''
+        TF = self.rng.integers(1, 3, (self.n_cand, 1))
+        novos_alunos = self.vet_cand + self.rng.random((self.n_cand, 1))*(prof - TF*media)
+
+        return self.limita_cands(novos_alunos, self.vet_cand)
+
+
+    def alunos_aluno(self):
+        '''
+        Novos alunos da fase aluno para a classe inteira: cada aluno dá um passo na direção do parceiro
+        sorteado, se o parceiro tiver menor custo, ou na direção oposta, caso contrário
+        '''
+        k = self.sorteia_parceiros()
+
+        # Definindo o passo na direção do que possui menor custo
+        sinal = np.where(self.vet_custos <= self.vet_custos[k], 1.0, -1.0)[:, np.newaxis]
+        passo = sinal*(self.vet_cand - self.vet_cand[k])
+
+        novos_alunos = self.vet_cand + self.rng.random((self.n_cand, 1))*passo
+
+        return self.limita_cands(novos_alunos, self.vet_cand)
+
+
+    def sorteia_parceiros(self):
+        '''
+        Sorteia o parceiro de cada aluno na fase aluno através de um desarranjo (permutação sem pontos fixos),
+        garantindo que nenhum aluno seja pareado consigo mesmo. Permutações com ponto fixo são descartadas
+        (em média, e ≈ 2.7 sorteios).
+        '''
+        while True:
+            k = self.rng.permutation(self.n_cand)
+            if not np.any(k == np.arange(self.n_cand)):
+                return k
+
+
+    def aplica_melhoras(self, novos_alunos, novos_custos):
+        '''
+        Substitui apenas os alunos cujo novo aluno reduziu o custo
+        '''
+        melhora = novos_custos < self.vet_custos
+        self.vet_cand[melhora] = novos_alunos[melhora]
+        self.vet_custos[melhora] = novos_custos[melhora]
@@ -0,0 +1,104 @@
+'''
+Execução assíncrona (assincrono.py) com uma função custo de latência artificial: o número de avaliações em
+andamento não passa de max_simultaneas, o orçamento de gerações e a contagem de avaliações são respeitados
+e os critérios de parada interrompem a execução
+'''
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from otimizacao import ED, PSO, CriterioParada, ExecucaoAssincrona
+from benchmarks.funcoes import rastrigin
+
+DIM = 4
+N_POP = 10
+LIM_INF = -5.12*np.ones(DIM)
+LIM_SUP = np.array([5.12, 3, 4, 5.])
+
+OTIMIZADORES = {
+    'ed': lambda n, **kw: ED(N_POP, DIM, n, 0.9, LIM_INF, LIM_SUP, rastrigin, seed=0, executar=False, **kw),
+    'pso': lambda n, **kw: PSO(N_POP, DIM, LIM_INF, LIM_SUP, n, rastrigin, seed=0, executar=False, **kw),
+}
+
+
+class Latencia(object):
+    '''
+    Função custo "async" que espera de 1 a 4 ms antes de responder, registrando as avaliações em andamento
+    '''
+
+    def __init__(self):
+        self.chamadas = 0
+        self.em_andamento = 0
+        self.max_em_andamento = 0
+
+
+    async def __call__(self, x):
+        self.chamadas += 1
+        self.em_andamento += 1
+        self.max_em_andamento = max(self.max_em_andamento, self.em_andamento)
+
+        await asyncio.sleep(0.001*(1 + self.chamadas % 4))
+
+        self.em_andamento -= 1
+        return rastrigin(x)
+
+
+class LatenciaBloqueante(Latencia):
+    '''
+    Mesma função como chamada comum (bloqueante), executada pela execução assíncrona em threads
+    '''
+
+    def __init__(self):
+        Latencia.__init__(self)
+        self.trava = threading.Lock()
+
+
+    def __call__(self, x):
+        with self.trava:
+            self.chamadas += 1
+            self.em_andamento += 1
+            self.max_em_andamento = max(self.max_em_andamento, self.em_andamento)
+            espera = 0.001*(1 + self.chamadas % 4)
+
+        time.sleep(espera)
+
+        with self.trava:
+            self.em_andamento -= 1
+        return rastrigin(x)
+
+
+@pytest.mark.parametrize('stub', [Latencia, LatenciaBloqueante])
+@pytest.mark.parametrize('nome', sorted(OTIMIZADORES))
+def test_limite_de_avaliacoes_simultaneas(nome, stub):
+    f = stub()
+    ExecucaoAssincrona(OTIMIZADORES[nome](10), f, max_simultaneas=3).run()
+
+    assert f.max_em_andamento == 3
+
+
+@pytest.mark.parametrize('nome', sorted(OTIMIZADORES))
+def test_geracoes_e_avaliacoes(nome):
+    f = Latencia()
+    otim = OTIMIZADORES[nome](12)
+    best, custo = ExecucaoAssincrona(otim, f, max_simultaneas=4).run()
+
+    assert otim.geracao == 12
+    assert otim.n_avaliacoes == f.chamadas == N_POP*(1 + 12)
+    assert otim.motivo_parada is None
+    assert custo == otim.get_best()[1] == rastrigin(best)
+
+
+@pytest.mark.parametrize('nome', sorted(OTIMIZADORES))
+def test_parada_por_avaliacoes(nome):
+    f = Latencia()
+    otim = OTIMIZADORES[nome](50, parada=CriterioParada(max_avaliacoes=60))
+    ExecucaoAssincrona(otim, f, max_simultaneas=4).run()
+
+    # A parada é verificada ao fim de cada geração; as avaliações já em andamento ainda são concluídas
+    assert otim.motivo_parada == 'max_avaliacoes'
+    assert otim.geracao < 50
+    assert otim.n_avaliacoes == f.chamadas
+    assert 60 <= otim.n_avaliacoes < 60 + 4
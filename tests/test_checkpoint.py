@@ -0,0 +1,66 @@
+'''
+Uma execução interrompida e retomada a partir do checkpoint deve terminar exatamente como a execução
+sem interrupção, com a mesma semente
+'''
+import numpy as np
+import pytest
+
+from otimizacao import GA, ED, PSO, TLBO, PreSelecao, salva_estado, carrega_estado
+from benchmarks.funcoes import rastrigin, onemax
+
+DIM = 4
+LIM_INF = -5.12*np.ones(DIM)
+LIM_SUP = np.array([5.12, 3, 4, 5.])
+
+OTIMIZADORES = {
+    'ed': lambda n, **kw: ED(12, DIM, n, 0.9, LIM_INF, LIM_SUP, rastrigin, **kw),
+    'ed_assincrona': lambda n, **kw: ED(12, DIM, n, 0.9, LIM_INF, LIM_SUP, rastrigin, sincrono=False, **kw),
+    'ed_jde': lambda n, **kw: ED(12, DIM, n, 0.9, LIM_INF, LIM_SUP, rastrigin, adaptacao='jde', **kw),
+    'ed_shade': lambda n, **kw: ED(12, DIM, n, 0.9, LIM_INF, LIM_SUP, rastrigin, adaptacao='shade', **kw),
+    'ed_surrogato': lambda n, **kw: ED(12, DIM, n, 0.9, LIM_INF, LIM_SUP, rastrigin, surrogato=PreSelecao(), **kw),
+    'pso': lambda n, **kw: PSO(12, DIM, LIM_INF, LIM_SUP, n, rastrigin, **kw),
+    'pso_adaptativa': lambda n, **kw: PSO(12, DIM, LIM_INF, LIM_SUP, n, rastrigin, sincrono=False, modo_inercia='adaptativa', **kw),
+    'tlbo': lambda n, **kw: TLBO(12, n, DIM, LIM_INF, LIM_SUP, rastrigin, False, **kw),
+    'tlbo_surrogato': lambda n, **kw: TLBO(12, n, DIM, LIM_INF, LIM_SUP, rastrigin, False, sincrono=False, surrogato=PreSelecao(), **kw),
+    'ga': lambda n, **kw: GA(12, 20, 0.9, 0.1, n, onemax, **kw),
+    'ga_empacotado': lambda n, **kw: GA(12, 20, 0.9, 0.1, n, onemax, empacotado=True, **kw),
+    'ga_real': lambda n, **kw: GA(12, DIM, 0.9, 0.1, n, rastrigin, limInf=LIM_INF, limSup=LIM_SUP, **kw),
+}
+
+GERADORES = {
+    'pcg64': lambda: 0,
+    'mt19937': lambda: np.random.Generator(np.random.MT19937(0)),
+    'philox': lambda: np.random.Generator(np.random.Philox(0)),
+    'sfc64': lambda: np.random.Generator(np.random.SFC64(0)),
+}
+
+
+def retomada_igual(tmp_path, cria, seed):
+    caminho = str(tmp_path / 'estado.npz')
+
+    # Execução interrompida após 10 das 20 gerações (a inércia do PSO, por exemplo, depende do total de gerações)
+    interrompido = cria(20, seed=seed(), executar=False)
+    for _ in range(10):
+        interrompido.step()
+    salva_estado(interrompido, caminho)
+
+    retomado = cria(20, seed=seed(), executar=False)
+    carrega_estado(retomado, caminho)
+    retomado.run()
+
+    direto = cria(20, seed=seed())
+
+    best_r, custo_r = retomado.get_best()
+    best_d, custo_d = direto.get_best()
+    assert custo_r == custo_d
+    assert np.array_equal(best_r, best_d)
+
+
+@pytest.mark.parametrize('nome', sorted(OTIMIZADORES))
+def test_retomada(tmp_path, nome):
+    retomada_igual(tmp_path, OTIMIZADORES[nome], GERADORES['pcg64'])
+
+
+@pytest.mark.parametrize('gerador', sorted(GERADORES))
+def test_retomada_geradores(tmp_path, gerador):
+    retomada_igual(tmp_path, OTIMIZADORES['ed'], GERADORES[gerador])
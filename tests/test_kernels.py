@@ -0,0 +1,50 @@
+'''
+Os kernels Numba (kernels.py) devem reproduzir exatamente o caminho NumPy: com a mesma semente, os
+otimizadores chegam às mesmas soluções e custos, bit a bit. Sem Numba instalado, forçar TEM_NUMBA executa
+os corpos das funções "_jit" como Python puro, o que também verifica a lógica dos laços.
+'''
+import numpy as np
+import pytest
+
+from otimizacao import kernels, GA, ED, PSO, TLBO
+from benchmarks.funcoes import rastrigin, onemax
+
+DIM = 4
+LIM_INF = -5.12*np.ones(DIM)
+LIM_SUP = np.array([5.12, 3, 4, 5.])
+
+OTIMIZADORES = {
+    'ed': lambda **kw: ED(12, DIM, 15, 0.9, LIM_INF, LIM_SUP, rastrigin, seed=0, **kw),
+    'ed_reflexao': lambda **kw: ED(12, DIM, 15, 0.9, LIM_INF, LIM_SUP, rastrigin, seed=0, estrategia_limites='reflexao', **kw),
+    'pso': lambda **kw: PSO(12, DIM, LIM_INF, LIM_SUP, 15, rastrigin, seed=0, **kw),
+    'pso_ponto_medio': lambda **kw: PSO(12, DIM, LIM_INF, LIM_SUP, 15, rastrigin, seed=0, estrategia_limites='ponto_medio', **kw),
+    'tlbo': lambda **kw: TLBO(12, 15, DIM, LIM_INF, LIM_SUP, rastrigin, False, seed=0, **kw),
+    'ga': lambda **kw: GA(12, 20, 0.9, 0.1, 15, onemax, seed=0, **kw),
+    'ga_empacotado': lambda **kw: GA(12, 20, 0.9, 0.1, 15, onemax, seed=0, empacotado=True, **kw),
+}
+
+
+def executa(monkeypatch, nome, jit, vectorized):
+    monkeypatch.setattr(kernels, 'TEM_NUMBA', jit)
+    return OTIMIZADORES[nome](vectorized=vectorized).get_best()
+
+
+@pytest.mark.parametrize('vectorized', [True, False])
+@pytest.mark.parametrize('nome', sorted(OTIMIZADORES))
+def test_kernels_identicos(monkeypatch, nome, vectorized):
+    best_jit, custo_jit = executa(monkeypatch, nome, True, vectorized)
+    best_numpy, custo_numpy = executa(monkeypatch, nome, False, vectorized)
+
+    assert np.array_equal(best_jit, best_numpy)
+    assert custo_jit == custo_numpy
+
+
+def test_limita_95(monkeypatch):
+    cand = np.random.default_rng(0).uniform(-10, 10, (50, DIM))
+
+    monkeypatch.setattr(kernels, 'TEM_NUMBA', True)
+    jit = kernels.limita_95(cand, LIM_INF, LIM_SUP)
+    monkeypatch.setattr(kernels, 'TEM_NUMBA', False)
+    numpy = kernels.limita_95(cand, LIM_INF, LIM_SUP)
+
+    assert np.array_equal(jit, numpy)
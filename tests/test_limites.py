@@ -0,0 +1,65 @@
+'''
+Toda estratégia de limites deve devolver candidatos dentro de [lim_inf, lim_sup], inclusive com limites de
+mesmo sinal (Bukin N. 6: x1 em [-15, -5]), e os otimizadores com as estratégias padrão devem terminar com
+toda a população dentro dos limites
+'''
+import numpy as np
+import pytest
+
+from otimizacao import kernels, ED, PSO, TLBO, PSOLote, EDLote, TLBOLote
+from otimizacao.limites import ESTRATEGIAS, cria_estrategia
+from benchmarks.funcoes import bukin6, limites
+
+LIM_INF, LIM_SUP = limites('bukin6', 2)
+
+
+def dentro(cands):
+    return np.all((cands >= LIM_INF) & (cands <= LIM_SUP))
+
+
+@pytest.mark.parametrize('nome', sorted(ESTRATEGIAS))
+def test_estrategia_dentro_dos_limites(nome):
+    rng = np.random.default_rng(0)
+    cands = rng.uniform(-40, 20, (200, 2))
+    pais = rng.uniform(LIM_INF, LIM_SUP, (200, 2))
+
+    assert dentro(cria_estrategia(nome).aplica(cands, LIM_INF, LIM_SUP, pais=pais, rng=rng))
+
+
+@pytest.mark.parametrize('jit', [True, False])
+def test_95_simetrico(monkeypatch, jit):
+    # Com limites simétricos, as regras a 95% mantêm os valores originais 0.95*lim_inf e 0.95*lim_sup
+    monkeypatch.setattr(kernels, 'TEM_NUMBA', jit)
+    lim_inf, lim_sup = np.array([-5., -3.]), np.array([5., 3.])
+    cands = np.random.default_rng(0).uniform(-10, 10, (50, 2))
+
+    esperado = np.where(cands > lim_sup, 0.95*lim_sup, np.where(cands < lim_inf, 0.95*lim_inf, cands))
+    assert np.array_equal(cria_estrategia('fator95').aplica(cands, lim_inf, lim_sup), esperado)
+    assert np.array_equal(cria_estrategia('corte95').aplica(cands, lim_inf, lim_sup), np.clip(cands, 0.95*lim_inf, 0.95*lim_sup))
+
+
+@pytest.mark.parametrize('vectorized', [True, False])
+@pytest.mark.parametrize('jit', [True, False])
+def test_otimizadores_dentro_dos_limites(monkeypatch, jit, vectorized):
+    monkeypatch.setattr(kernels, 'TEM_NUMBA', jit)
+
+    assert dentro(PSO(40, 2, LIM_INF, LIM_SUP, 50, bukin6, vectorized=vectorized, seed=0).get_pop())
+    assert dentro(PSO(40, 2, LIM_INF, LIM_SUP, 50, bukin6, vectorized=vectorized, sincrono=False, seed=0).get_pop())
+    assert dentro(ED(40, 2, 50, 0.9, LIM_INF, LIM_SUP, bukin6, vectorized=vectorized, seed=0).get_pop())
+
+
+@pytest.mark.parametrize('sincrono', [True, False])
+@pytest.mark.parametrize('jit', [True, False])
+def test_tlbo_dentro_dos_limites(monkeypatch, jit, sincrono):
+    # Configuração de exemplos/tlbo.py, com a estratégia padrão 'fator95' e limites inteiros
+    monkeypatch.setattr(kernels, 'TEM_NUMBA', jit)
+    otim = TLBO(40, 100, 2, np.array([-15, -3]), np.array([-5, 3]), bukin6, False, sincrono=sincrono, seed=0)
+
+    assert dentro(otim.get_pop())
+    assert dentro(otim.get_best()[0])
+
+
+def test_lotes_dentro_dos_limites():
+    assert dentro(PSOLote(4, 40, 2, LIM_INF, LIM_SUP, 50, bukin6, seed=0).pop)
+    assert dentro(EDLote(4, 40, 2, 50, 0.9, LIM_INF, LIM_SUP, bukin6, seed=0).vet_cand)
+    assert dentro(TLBOLote(4, 40, 50, 2, LIM_INF, LIM_SUP, bukin6, seed=0).vet_cand)